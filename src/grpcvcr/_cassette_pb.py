@@ -0,0 +1,102 @@
+"""Protobuf schema for binary (`.pb`) cassettes.
+
+The message classes are built from a descriptor at import time instead of
+checked-in generated code, so they work with any supported protobuf runtime.
+The schema is equivalent to:
+
+```proto
+syntax = "proto2";
+package grpcvcr.cassette;
+
+message Header { optional uint32 version = 1; }
+message MetadataEntry { optional string key = 1; repeated string values = 2; }
+message Request {
+  optional string method = 1;
+  optional bytes body = 2;
+  repeated MetadataEntry metadata = 3;
+}
+message Response {
+  optional bytes body = 1;
+  repeated bytes messages = 2;
+  optional string code = 3;
+  optional string details = 4;
+  repeated MetadataEntry trailing_metadata = 5;
+  optional string response_type = 6;
+}
+message Interaction {
+  optional Request request = 1;
+  optional Response response = 2;
+  optional string rpc_type = 3;
+}
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+_PACKAGE = "grpcvcr.cassette"
+
+_F = descriptor_pb2.FieldDescriptorProto
+_MESSAGES: dict[str, list[tuple[str, int, int, int, str | None]]] = {
+    "Header": [
+        ("version", 1, _F.TYPE_UINT32, _F.LABEL_OPTIONAL, None),
+    ],
+    "MetadataEntry": [
+        ("key", 1, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+        ("values", 2, _F.TYPE_STRING, _F.LABEL_REPEATED, None),
+    ],
+    "Request": [
+        ("method", 1, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+        ("body", 2, _F.TYPE_BYTES, _F.LABEL_OPTIONAL, None),
+        ("metadata", 3, _F.TYPE_MESSAGE, _F.LABEL_REPEATED, "MetadataEntry"),
+    ],
+    "Response": [
+        ("body", 1, _F.TYPE_BYTES, _F.LABEL_OPTIONAL, None),
+        ("messages", 2, _F.TYPE_BYTES, _F.LABEL_REPEATED, None),
+        ("code", 3, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+        ("details", 4, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+        ("trailing_metadata", 5, _F.TYPE_MESSAGE, _F.LABEL_REPEATED, "MetadataEntry"),
+        ("response_type", 6, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+    ],
+    "Interaction": [
+        ("request", 1, _F.TYPE_MESSAGE, _F.LABEL_OPTIONAL, "Request"),
+        ("response", 2, _F.TYPE_MESSAGE, _F.LABEL_OPTIONAL, "Response"),
+        ("rpc_type", 3, _F.TYPE_STRING, _F.LABEL_OPTIONAL, None),
+    ],
+}
+
+
+def _build_classes() -> dict[str, Any]:
+    """Register the cassette schema in a private pool and build its message classes."""
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="grpcvcr/cassette.proto",
+        package=_PACKAGE,
+        syntax="proto2",
+    )
+    for message_name, fields in _MESSAGES.items():
+        message_proto = file_proto.message_type.add(name=message_name)
+        for name, number, type_, label, type_name in fields:
+            field_proto = message_proto.field.add(name=name, number=number, type=type_, label=label)
+            if type_name is not None:
+                field_proto.type_name = f".{_PACKAGE}.{type_name}"
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+
+    classes: dict[str, Any] = {}
+    for message_name in _MESSAGES:
+        descriptor = pool.FindMessageTypeByName(f"{_PACKAGE}.{message_name}")
+        if hasattr(message_factory, "GetMessageClass"):
+            classes[message_name] = message_factory.GetMessageClass(descriptor)
+        else:  # pragma: no cover - protobuf < 4.22
+            classes[message_name] = message_factory.MessageFactory(pool).GetPrototype(descriptor)
+    return classes
+
+
+_CLASSES = _build_classes()
+
+Header: Any = _CLASSES["Header"]
+Interaction: Any = _CLASSES["Interaction"]
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import threading
-from collections.abc import Generator
+from collections.abc import Generator, Hashable
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from grpcvcr.errors import (
     CassetteNotFoundError,
     NoMatchingInteractionError,
     RecordingDisabledError,
 )
-from grpcvcr.matchers import DEFAULT_MATCHER, Matcher, find_matching_interaction
+from grpcvcr.matchers import DEFAULT_MATCHER, Matcher, MethodMatcher, find_matching_interaction
 from grpcvcr.record_modes import RecordMode
 from grpcvcr.serialization import (
     CassetteData,
@@ -22,8 +23,15 @@ from grpcvcr.serialization import (
     InteractionRequest,
 )
 
+if TYPE_CHECKING:
+    import grpc
+    from grpc import aio
 
-@dataclass
+_RECORDING_MODES = frozenset({RecordMode.ALL, RecordMode.NEW_EPISODES, RecordMode.ONCE})
+"""Record modes that allow new interactions to be recorded."""
+
+
+@dataclass(slots=True)
 class Cassette:
     """A collection of recorded gRPC interactions.
 
@@ -61,6 +69,18 @@ class Cassette:
     _data: CassetteData = field(default_factory=CassetteData, init=False)
     _dirty: bool = field(default=False, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _index: dict[Hashable, list[int]] = field(default_factory=dict, init=False)
+    _indexed: int = field(default=0, init=False)
+    _index_source: list[Interaction] | None = field(default=None, init=False)
+    _index_matcher: Matcher | None = field(default=None, init=False)
+    _responses: dict[tuple[str, bytes, tuple[tuple[str, str], ...] | None], Interaction] = field(
+        default_factory=dict, init=False
+    )
+    _responses_state: tuple[list[Interaction], int, Matcher] | None = field(default=None, init=False)
+    _persisted: int = field(default=0, init=False)
+    _persisted_source: list[Interaction] | None = field(default=None, init=False)
+    _interceptors: tuple[grpc.ClientInterceptor, ...] | None = field(default=None, init=False)
+    _async_interceptors: tuple[aio.ClientInterceptor, ...] | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         if isinstance(self.path, str):
@@ -68,9 +88,18 @@ class Cassette:
         self._load()
 
     def _load(self) -> None:
-        """Load cassette from disk if it exists."""
-        if self.path.exists():
+        """Load cassette from disk if it exists.
+
+        `RecordMode.ALL` re-records everything, so it starts from an empty
+        cassette without reading the file and overwrites it on save.
+        """
+        if self.record_mode == RecordMode.ALL:
+            self._data = CassetteData()
+            self._dirty = True
+        elif self.path.exists():
             self._data = CassetteSerializer.load(self.path)
+            self._persisted = len(self._data.interactions)
+            self._persisted_source = self._data.interactions
         elif self.record_mode == RecordMode.NONE:
             raise CassetteNotFoundError(str(self.path))
         elif self.record_mode == RecordMode.ONCE:
@@ -80,10 +109,27 @@ class Cassette:
         """Save cassette to disk if it has been modified.
 
         Called automatically when using the cassette as a context manager.
+        For `.jsonl` and `.pb` cassettes whose file already holds the earlier
+        interactions, only the newly recorded ones are appended.
         """
-        if self._dirty:
+        if not self._dirty:
+            return
+
+        interactions = self._data.interactions
+        if (
+            self._persisted_source is interactions
+            and self._persisted <= len(interactions)
+            and CassetteSerializer.can_append(self.path)
+            and self.path.exists()
+            # An empty file has no header yet, so it must be written in full.
+            and self.path.stat().st_size > 0
+        ):
+            CassetteSerializer.append(self.path, interactions[self._persisted :])
+        else:
             CassetteSerializer.save(self.path, self._data)
-            self._dirty = False
+        self._persisted = len(interactions)
+        self._persisted_source = interactions
+        self._dirty = False
 
     @property
     def interactions(self) -> list[Interaction]:
@@ -93,46 +139,173 @@ class Cassette:
     @property
     def can_record(self) -> bool:
         """Whether recording is allowed in the current mode."""
-        return self.record_mode in (RecordMode.ALL, RecordMode.NEW_EPISODES, RecordMode.ONCE)
+        return self.record_mode in _RECORDING_MODES
+
+    def _sync_index(self) -> dict[Hashable, list[int]]:
+        """Bring the request index up to date with the interaction list.
+
+        New interactions are indexed incrementally. The index is rebuilt
+        from scratch if the list or matcher was replaced or the list shrank.
+        Must be called with `_lock` held.
+        """
+        interactions = self._data.interactions
+        if (
+            self._index_source is not interactions
+            or self._index_matcher is not self.match_on
+            or len(interactions) < self._indexed
+        ):
+            self._index = {}
+            self._indexed = 0
+            self._index_source = interactions
+            self._index_matcher = self.match_on
+
+        index = self._index
+        index_key = self.match_on.index_key
+        # Read the length once: unlocked appends may land while indexing, and
+        # they must be picked up on the next call rather than skipped.
+        end = len(interactions)
+        for position in range(self._indexed, end):
+            index.setdefault(index_key(interactions[position].request), []).append(position)
+        self._indexed = end
+        return index
+
+    def _matching_positions(self, request: InteractionRequest) -> list[int]:
+        """Positions of all recorded interactions matching a request.
+
+        Must be called with `_lock` held.
+        """
+        key = self.match_on.index_key(request)
+        interactions = self._data.interactions
+        positions = range(len(interactions)) if key is None else self._sync_index().get(key, ())
+        matches = self.match_on.matches
+        return [p for p in positions if matches(request, interactions[p].request)]
 
     def find_interaction(self, request: InteractionRequest) -> Interaction | None:
         """Find a matching recorded interaction for a request.
 
+        When the matcher provides an index key, only recorded interactions
+        with the same key are checked.
+
         Args:
             request: The request to match.
 
         Returns:
             The matching Interaction, or None if not found.
         """
-        return find_matching_interaction(request, self.interactions, self.match_on)
+        key = self.match_on.index_key(request)
+        if key is None:
+            return find_matching_interaction(request, self.interactions, self.match_on)
+
+        with self._lock:
+            positions = self._sync_index().get(key, ())
+            candidates = [self._data.interactions[p] for p in positions]
+        return find_matching_interaction(request, candidates, self.match_on)
 
     def record_interaction(self, interaction: Interaction) -> None:
         """Record a new interaction to the cassette.
 
         In `RecordMode.ALL`, existing interactions with the same request
-        (based on the matcher) are replaced. In other modes, new
-        interactions are appended.
+        (based on the matcher) are replaced. A single previous recording is
+        replaced in place. In other modes, new interactions are appended.
 
         Args:
             interaction: The interaction to record.
         """
-        with self._lock:
-            if self.record_mode == RecordMode.ALL:
-                self._data.interactions = [
-                    i for i in self._data.interactions if not self.match_on.matches(interaction.request, i.request)
-                ]
-
+        if self.record_mode is not RecordMode.ALL:
+            # A bare list.append is atomic, so plain appends skip the lock.
+            self._responses.clear()
             self._data.interactions.append(interaction)
             self._dirty = True
+            return
+
+        with self._lock:
+            self._responses.clear()
+            stale = self._matching_positions(interaction.request)
+            if len(stale) == 1:
+                self._data.interactions[stale[0]] = interaction
+                # The file holds the replaced entry, so the next save must rewrite it.
+                self._persisted_source = None
+            else:
+                if stale:
+                    removed = set(stale)
+                    self._data.interactions = [
+                        i for position, i in enumerate(self._data.interactions) if position not in removed
+                    ]
+                self._data.interactions.append(interaction)
+            self._dirty = True
+
+    def find_recorded(
+        self,
+        method: str,
+        request_body: bytes | memoryview,
+        metadata: tuple[tuple[str, str], ...] | None = None,
+    ) -> Interaction | None:
+        """Find the recorded interaction for a raw gRPC request.
+
+        Hits are memoized per `(method, request_body, metadata)`, so
+        repeated identical requests skip both building an
+        `InteractionRequest` and matching. The memo is cleared whenever an
+        interaction is recorded, the interaction list changes length or is
+        replaced, or `match_on` changes.
+
+        `request_body` may be a memoryview over a larger buffer; it is
+        encoded directly without first being copied into `bytes`. Only
+        `bytes` bodies are memoized, so a view never pins its buffer.
+
+        Args:
+            method: Full gRPC method path.
+            request_body: Serialized protobuf request.
+            metadata: Optional request metadata (headers).
+
+        Returns:
+            The matching Interaction, or None if not found.
+        """
+        state = self._responses_state
+        interactions = self._data.interactions
+        if (
+            state is None
+            or state[0] is not interactions
+            or state[1] != len(interactions)
+            or state[2] is not self.match_on
+        ):
+            self._responses = {}
+            self._responses_state = (interactions, len(interactions), self.match_on)
+
+        cache_key = None
+        if isinstance(request_body, bytes):
+            try:
+                cache_key = (method, request_body, metadata)
+                interaction = self._responses.get(cache_key)
+            except TypeError:
+                # Unhashable metadata (e.g. a list of pairs) is never memoized.
+                cache_key = None
+            else:
+                if interaction is not None:
+                    return interaction
+
+        if type(self.match_on) is MethodMatcher:
+            # The default matcher only compares method paths, so the first
+            # indexed interaction for the method is the match and no
+            # InteractionRequest needs to be built.
+            with self._lock:
+                positions = self._sync_index().get(method)
+                interaction = self._data.interactions[positions[0]] if positions else None
+        else:
+            interaction = self.find_interaction(InteractionRequest.from_grpc(method, request_body, metadata))
+        if interaction is not None and cache_key is not None:
+            self._responses[cache_key] = interaction
+        return interaction
 
     def get_response(
         self,
         method: str,
-        request_body: bytes,
+        request_body: bytes | memoryview,
         metadata: tuple[tuple[str, str], ...] | None = None,
     ) -> Interaction:
         """Get the recorded response for a request.
 
+        Lookups go through `find_recorded`, so they share its memo.
+
         Args:
             method: Full gRPC method path.
             request_body: Serialized protobuf request.
@@ -147,14 +320,11 @@ class Cassette:
             RecordingDisabledError: If no matching interaction is found
                 and recording is disabled.
         """
-        request = InteractionRequest.from_grpc(method, request_body, metadata)
-        interaction = self.find_interaction(request)
-
+        interaction = self.find_recorded(method, request_body, metadata)
         if interaction is None:
             if not self.can_record:
                 raise RecordingDisabledError(method)
-            raise NoMatchingInteractionError(method, request_body, self.interactions)
-
+            raise NoMatchingInteractionError(method, bytes(request_body), list(self.interactions))
         return interaction
 
     def __enter__(self) -> Cassette:
@@ -194,7 +364,7 @@ def use_cassette(
         ```
     """
     cassette = Cassette(
-        path=Path(path),
+        path=path if isinstance(path, Path) else Path(path),
         record_mode=record_mode,
         match_on=match_on or DEFAULT_MATCHER,
     )
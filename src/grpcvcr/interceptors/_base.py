@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import grpc
 
+from grpcvcr.record_modes import RecordMode
 from grpcvcr.serialization import (
     Interaction,
     InteractionResponse,
     StreamingInteractionResponse,
 )
 
+_RECORD_ALL = RecordMode.ALL
+"""Bound once, since attribute access on an Enum class is comparatively slow on the per-call path."""
+
+_STATUS_CODES: dict[str, grpc.StatusCode] = {status.name: status for status in grpc.StatusCode}
+"""Status codes by name; a plain dict lookup is much cheaper than `grpc.StatusCode[name]`."""
+
 
 def create_unary_response(
     interaction: Interaction,
@@ -31,14 +38,11 @@ def create_unary_response(
     response = interaction.response
     assert isinstance(response, InteractionResponse)
 
-    body_bytes = response.get_body_bytes()
-    deserialized = response_deserializer(body_bytes)
-
     return _FakeUnaryCall(
-        result=deserialized,
-        code=grpc.StatusCode[response.code],
+        result=response.deserialize(response_deserializer),
+        code=_STATUS_CODES[response.code],
         details=response.details,
-        trailing_metadata=_dict_to_metadata(response.trailing_metadata),
+        trailing_metadata=response.trailing_metadata_pairs(),
     )
 
 
@@ -59,32 +63,39 @@ def create_streaming_response(
     response = interaction.response
     assert isinstance(response, StreamingInteractionResponse)
 
-    messages = [response_deserializer(m) for m in response.get_messages_bytes()]
-
     return _FakeStreamingCall(
-        messages=messages,
-        code=grpc.StatusCode[response.code],
+        messages=response.iter_messages(response_deserializer),
+        code=_STATUS_CODES[response.code],
         details=response.details,
-        trailing_metadata=_dict_to_metadata(response.trailing_metadata),
+        trailing_metadata=response.trailing_metadata_pairs(),
     )
 
 
-def _dict_to_metadata(d: dict[str, list[str]]) -> tuple[tuple[str, str], ...]:
-    """Convert metadata dict back to gRPC tuple format."""
-    result: list[tuple[str, str]] = []
-    for key, values in d.items():
-        for value in values:
-            result.append((key, value))
-    return tuple(result)
+def _passthrough(data: bytes) -> bytes:
+    """Deserializer for calls whose message type is unknown: keep the raw bytes."""
+    return data
+
+
+def _playback_deserializer(
+    response: InteractionResponse | StreamingInteractionResponse,
+    request_type: type | None,
+) -> Callable[[bytes], Any]:
+    """Pick the deserializer for a recorded response.
+
+    Prefers the recorded response type, then the request's message type,
+    and finally returns raw bytes when neither is known.
+    """
+    response_class = response.get_response_class()
+    if response_class:
+        return response_class.FromString
+    if request_type is not None:
+        return request_type.FromString
+    return _passthrough
 
 
-def _metadata_to_dict(metadata: tuple[tuple[str, str], ...] | None) -> dict[str, list[str]]:
-    """Convert gRPC metadata tuple to dict format for storage."""
-    result: dict[str, list[str]] = {}
-    if metadata:
-        for key, value in metadata:
-            result.setdefault(key, []).append(value)
-    return result
+def _method_path(method: str | bytes) -> str:
+    """Return a call's method path as text; grpc.aio reports it as bytes."""
+    return method.decode("utf-8") if isinstance(method, bytes) else method
 
 
 class _FakeUnaryCall(grpc.Call, grpc.Future):  # type: ignore[misc]
@@ -168,26 +179,21 @@ class _FakeStreamingCall(grpc.Call):  # type: ignore[misc]
 
     def __init__(
         self,
-        messages: list[object],
+        messages: Iterable[object],
         code: grpc.StatusCode,
         details: str | None,
         trailing_metadata: tuple[tuple[str, str], ...],
     ) -> None:
-        self._messages = messages
+        self._iterator = iter(messages)
         self._code = code
         self._details = details
         self._trailing_metadata = trailing_metadata
-        self._index = 0
 
     def __iter__(self) -> _FakeStreamingCall:
         return self
 
     def __next__(self) -> object:
-        if self._index >= len(self._messages):
-            raise StopIteration
-        msg = self._messages[self._index]
-        self._index += 1
-        return msg
+        return next(self._iterator)
 
     def code(self) -> grpc.StatusCode:
         return self._code
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Generator, Iterable
 from typing import TYPE_CHECKING, Any
 
 import grpc
 from grpc import aio
 
 from grpcvcr.errors import RecordingDisabledError
-from grpcvcr.record_modes import RecordMode
+from grpcvcr.interceptors._base import _RECORD_ALL, _STATUS_CODES, _method_path, _playback_deserializer
 from grpcvcr.serialization import (
     Interaction,
     InteractionRequest,
     InteractionResponse,
     StreamingInteractionResponse,
+    _iter_serialized,
 )
 
 if TYPE_CHECKING:
@@ -40,18 +41,17 @@ class _AsyncFakeUnaryCall(aio.UnaryUnaryCall):  # type: ignore[misc]
         self._details = details
         self._trailing_metadata = trailing_metadata
 
-    def __await__(self) -> Any:
-        async def _get_result() -> Any:
-            if self._code != grpc.StatusCode.OK:
-                raise aio.AioRpcError(
-                    self._code,
-                    (),
-                    self._trailing_metadata,
-                    self._details,
-                )
-            return self._result
-
-        return _get_result().__await__()
+    def __await__(self) -> Generator[Any, None, Any]:
+        # A plain generator completes the await without allocating a coroutine.
+        if self._code != grpc.StatusCode.OK:
+            raise aio.AioRpcError(
+                self._code,
+                (),
+                self._trailing_metadata,
+                self._details,
+            )
+        yield from ()
+        return self._result
 
     async def code(self) -> grpc.StatusCode:
         return self._code
@@ -93,22 +93,26 @@ class _AsyncFakeStreamingCall(aio.Call):  # type: ignore[misc]
 
     def __init__(
         self,
-        messages: list[Any],
+        messages: Iterable[Any],
         code: grpc.StatusCode,
         details: str | None,
         trailing_metadata: tuple[tuple[str, str], ...],
     ) -> None:
-        self._messages = messages
+        self._iterator = iter(messages)
         self._code = code
         self._details = details
         self._trailing_metadata = trailing_metadata
 
-    def __aiter__(self) -> AsyncIterator[Any]:
-        return self._iterate()
+    def __aiter__(self) -> _AsyncFakeStreamingCall:
+        return self
 
-    async def _iterate(self) -> AsyncIterator[Any]:
-        for msg in self._messages:
-            yield msg
+    async def __anext__(self) -> Any:
+        # A plain coroutine per message avoids the async-generator machinery;
+        # nothing here ever awaits.
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            pass
         if self._code != grpc.StatusCode.OK:
             raise aio.AioRpcError(
                 self._code,
@@ -116,6 +120,7 @@ class _AsyncFakeStreamingCall(aio.Call):  # type: ignore[misc]
                 self._trailing_metadata,
                 self._details,
             )
+        raise StopAsyncIteration
 
     async def code(self) -> grpc.StatusCode:
         return self._code
@@ -148,6 +153,30 @@ class _AsyncFakeStreamingCall(aio.Call):  # type: ignore[misc]
         pass
 
 
+def _replay_unary(interaction: Interaction, request_type: type | None) -> _AsyncFakeUnaryCall:
+    """Build a fake unary call that replays a recorded interaction."""
+    response = interaction.response
+    assert isinstance(response, InteractionResponse)
+    return _AsyncFakeUnaryCall(
+        result=response.deserialize(_playback_deserializer(response, request_type)),
+        code=_STATUS_CODES[response.code],
+        details=response.details,
+        trailing_metadata=response.trailing_metadata_pairs(),
+    )
+
+
+def _replay_streaming(interaction: Interaction, request_type: type | None) -> _AsyncFakeStreamingCall:
+    """Build a fake streaming call that replays a recorded interaction."""
+    response = interaction.response
+    assert isinstance(response, StreamingInteractionResponse)
+    return _AsyncFakeStreamingCall(
+        messages=response.iter_messages(_playback_deserializer(response, request_type)),
+        code=_STATUS_CODES[response.code],
+        details=response.details,
+        trailing_metadata=response.trailing_metadata_pairs(),
+    )
+
+
 class AsyncRecordingUnaryUnaryInterceptor(aio.UnaryUnaryClientInterceptor):  # type: ignore[misc]
     """Async interceptor for unary-unary RPCs (single request, single response)."""
 
@@ -160,32 +189,20 @@ class AsyncRecordingUnaryUnaryInterceptor(aio.UnaryUnaryClientInterceptor):  # t
         client_call_details: aio.ClientCallDetails,
         request: Any,
     ) -> aio.Call:
-        method = client_call_details.method
+        method = _method_path(client_call_details.method)
         request_bytes = request.SerializeToString()
         metadata = client_call_details.metadata
 
-        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
-
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, request_bytes, metadata)
             if interaction is not None:
-                response = interaction.response
-                assert isinstance(response, InteractionResponse)
-
-                response_class = response.get_response_class()
-                deserializer = response_class.FromString if response_class else type(request).FromString
-                result = deserializer(response.get_body_bytes())
-
-                return _AsyncFakeUnaryCall(
-                    result=result,
-                    code=grpc.StatusCode[response.code],
-                    details=response.details,
-                    trailing_metadata=tuple((k, v) for k, vs in response.trailing_metadata.items() for v in vs),
-                )
+                return _replay_unary(interaction, type(request))
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
+
         call = await continuation(client_call_details, request)
 
         try:
@@ -199,11 +216,13 @@ class AsyncRecordingUnaryUnaryInterceptor(aio.UnaryUnaryClientInterceptor):  # t
             response_type = None
             code = e.code().name
             details = e.details()
-
-        try:
-            trailing = await call.trailing_metadata()
-        except Exception:
-            trailing = ()
+            # The error already carries the trailing metadata.
+            trailing = e.trailing_metadata()
+        else:
+            try:
+                trailing = await call.trailing_metadata()
+            except Exception:
+                trailing = ()
 
         recorded = Interaction(
             request=req,
@@ -233,75 +252,58 @@ class AsyncRecordingUnaryStreamInterceptor(aio.UnaryStreamClientInterceptor):  #
         client_call_details: aio.ClientCallDetails,
         request: Any,
     ) -> aio.Call:
-        method = client_call_details.method
+        method = _method_path(client_call_details.method)
         request_bytes = request.SerializeToString()
         metadata = client_call_details.metadata
 
-        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
-
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, request_bytes, metadata)
             if interaction is not None:
-                response = interaction.response
-                assert isinstance(response, StreamingInteractionResponse)
-
-                response_class = response.get_response_class()
-                deserializer = response_class.FromString if response_class else type(request).FromString
-                messages = [deserializer(m) for m in response.get_messages_bytes()]
-
-                return _AsyncFakeStreamingCall(
-                    messages=messages,
-                    code=grpc.StatusCode[response.code],
-                    details=response.details,
-                    trailing_metadata=tuple((k, v) for k, vs in response.trailing_metadata.items() for v in vs),
-                )
+                return _replay_streaming(interaction, type(request))
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
+
         call = await continuation(client_call_details, request)
 
-        messages_bytes: list[bytes] = []
-        response_type: type | None = None
+        received: list[Any] = []
         code = "OK"
         details = None
 
         try:
             async for msg in call:
-                messages_bytes.append(msg.SerializeToString())
-                if response_type is None:
-                    response_type = type(msg)
+                received.append(msg)
         except aio.AioRpcError as e:
             code = e.code().name
             details = e.details()
-
-        try:
-            trailing = await call.trailing_metadata()
-        except Exception:
-            trailing = ()
+            # The error already carries the trailing metadata.
+            trailing = e.trailing_metadata()
+        else:
+            try:
+                trailing = await call.trailing_metadata()
+            except Exception:
+                trailing = ()
 
         recorded = Interaction(
             request=req,
             response=StreamingInteractionResponse.from_grpc(
-                messages=messages_bytes,
+                messages=_iter_serialized(received),
                 code=code,
                 details=details,
                 trailing_metadata=trailing,
-                response_type=response_type,
+                response_type=type(received[0]) if received else None,
             ),
             rpc_type="server_streaming",
         )
         self.cassette.record_interaction(recorded)
 
-        response = recorded.response
-        assert isinstance(response, StreamingInteractionResponse)
-        response_class = response.get_response_class()
-        deserializer = response_class.FromString if response_class else type(request).FromString
-
+        # The live stream has been consumed, so replay the messages it produced.
         return _AsyncFakeStreamingCall(
-            messages=[deserializer(m) for m in response.get_messages_bytes()],
-            code=grpc.StatusCode[response.code],
-            details=response.details,
+            messages=received,
+            code=_STATUS_CODES[code],
+            details=details,
             trailing_metadata=trailing,
         )
 
@@ -318,38 +320,22 @@ class AsyncRecordingStreamUnaryInterceptor(aio.StreamUnaryClientInterceptor):  #
         client_call_details: aio.ClientCallDetails,
         request_iterator: Any,
     ) -> aio.Call:
-        method = client_call_details.method
+        method = _method_path(client_call_details.method)
         metadata = client_call_details.metadata
 
-        requests = [r async for r in request_iterator]
-        combined_request = b"".join(r.SerializeToString() for r in requests)
+        requests: list[Any] = [r async for r in request_iterator]
+        combined_request = b"".join(_iter_serialized(requests))
 
-        req = InteractionRequest.from_grpc(method, combined_request, metadata)
-
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, combined_request, metadata)
             if interaction is not None:
-                response = interaction.response
-                assert isinstance(response, InteractionResponse)
-
-                response_class = response.get_response_class()
-                if response_class:
-                    result = response_class.FromString(response.get_body_bytes())
-                elif requests:
-                    result = type(requests[0]).FromString(response.get_body_bytes())
-                else:
-                    result = response.get_body_bytes()
-
-                return _AsyncFakeUnaryCall(
-                    result=result,
-                    code=grpc.StatusCode[response.code],
-                    details=response.details,
-                    trailing_metadata=tuple((k, v) for k, vs in response.trailing_metadata.items() for v in vs),
-                )
+                return _replay_unary(interaction, type(requests[0]) if requests else None)
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, combined_request, metadata)
+
         async def replay_requests() -> AsyncIterator[Any]:
             for r in requests:
                 yield r
@@ -367,11 +353,13 @@ class AsyncRecordingStreamUnaryInterceptor(aio.StreamUnaryClientInterceptor):  #
             response_type = None
             code = e.code().name
             details = e.details()
-
-        try:
-            trailing = await call.trailing_metadata()
-        except Exception:
-            trailing = ()
+            # The error already carries the trailing metadata.
+            trailing = e.trailing_metadata()
+        else:
+            try:
+                trailing = await call.trailing_metadata()
+            except Exception:
+                trailing = ()
 
         recorded = Interaction(
             request=req,
@@ -401,90 +389,64 @@ class AsyncRecordingStreamStreamInterceptor(aio.StreamStreamClientInterceptor):
         client_call_details: aio.ClientCallDetails,
         request_iterator: Any,
     ) -> aio.Call:
-        method = client_call_details.method
+        method = _method_path(client_call_details.method)
         metadata = client_call_details.metadata
 
-        requests = [r async for r in request_iterator]
-        combined_request = b"".join(r.SerializeToString() for r in requests)
-
-        req = InteractionRequest.from_grpc(method, combined_request, metadata)
+        requests: list[Any] = [r async for r in request_iterator]
+        combined_request = b"".join(_iter_serialized(requests))
 
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, combined_request, metadata)
             if interaction is not None:
-                response = interaction.response
-                assert isinstance(response, StreamingInteractionResponse)
-
-                response_class = response.get_response_class()
-                if response_class:
-                    messages = [response_class.FromString(m) for m in response.get_messages_bytes()]
-                elif requests:
-                    messages = [type(requests[0]).FromString(m) for m in response.get_messages_bytes()]
-                else:
-                    messages = response.get_messages_bytes()
-
-                return _AsyncFakeStreamingCall(
-                    messages=messages,
-                    code=grpc.StatusCode[response.code],
-                    details=response.details,
-                    trailing_metadata=tuple((k, v) for k, vs in response.trailing_metadata.items() for v in vs),
-                )
+                return _replay_streaming(interaction, type(requests[0]) if requests else None)
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, combined_request, metadata)
+
         async def replay_requests() -> AsyncIterator[Any]:
             for r in requests:
                 yield r
 
         call = await continuation(client_call_details, replay_requests())
 
-        messages_bytes: list[bytes] = []
-        response_type: type | None = None
+        received: list[Any] = []
         code = "OK"
         details = None
 
         try:
             async for msg in call:
-                messages_bytes.append(msg.SerializeToString())
-                if response_type is None:
-                    response_type = type(msg)
+                received.append(msg)
         except aio.AioRpcError as e:
             code = e.code().name
             details = e.details()
-
-        try:
-            trailing = await call.trailing_metadata()
-        except Exception:
-            trailing = ()
+            # The error already carries the trailing metadata.
+            trailing = e.trailing_metadata()
+        else:
+            try:
+                trailing = await call.trailing_metadata()
+            except Exception:
+                trailing = ()
 
         recorded = Interaction(
             request=req,
             response=StreamingInteractionResponse.from_grpc(
-                messages=messages_bytes,
+                messages=_iter_serialized(received),
                 code=code,
                 details=details,
                 trailing_metadata=trailing,
-                response_type=response_type,
+                response_type=type(received[0]) if received else None,
             ),
             rpc_type="bidi_streaming",
         )
         self.cassette.record_interaction(recorded)
 
-        response = recorded.response
-        assert isinstance(response, StreamingInteractionResponse)
-        response_class = response.get_response_class()
-        if response_class:
-            deserializer = response_class.FromString
-        elif requests:
-            deserializer = type(requests[0]).FromString
-        else:
-            deserializer = lambda x: x  # noqa: E731
-
+        # The live stream has been consumed, so replay the messages it produced.
         return _AsyncFakeStreamingCall(
-            messages=[deserializer(m) for m in response.get_messages_bytes()],
-            code=grpc.StatusCode[response.code],
-            details=response.details,
+            messages=received,
+            code=_STATUS_CODES[code],
+            details=details,
             trailing_metadata=trailing,
         )
 
@@ -498,9 +460,13 @@ def create_async_interceptors(cassette: Cassette) -> list[aio.ClientInterceptor]
     Returns:
         List of async interceptors covering all RPC types.
     """
-    return [
-        AsyncRecordingUnaryUnaryInterceptor(cassette),
-        AsyncRecordingUnaryStreamInterceptor(cassette),
-        AsyncRecordingStreamUnaryInterceptor(cassette),
-        AsyncRecordingStreamStreamInterceptor(cassette),
-    ]
+    interceptors = cassette._async_interceptors
+    if interceptors is None:
+        # The interceptors only hold the cassette, so every channel can share one set.
+        interceptors = cassette._async_interceptors = (
+            AsyncRecordingUnaryUnaryInterceptor(cassette),
+            AsyncRecordingUnaryStreamInterceptor(cassette),
+            AsyncRecordingStreamUnaryInterceptor(cassette),
+            AsyncRecordingStreamStreamInterceptor(cassette),
+        )
+    return list(interceptors)
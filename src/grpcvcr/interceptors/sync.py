@@ -9,19 +9,102 @@ import grpc
 
 from grpcvcr.errors import RecordingDisabledError
 from grpcvcr.interceptors._base import (
+    _RECORD_ALL,
+    _STATUS_CODES,
+    _FakeStreamingCall,
+    _playback_deserializer,
     create_streaming_response,
     create_unary_response,
 )
-from grpcvcr.record_modes import RecordMode
 from grpcvcr.serialization import (
     Interaction,
     InteractionRequest,
     InteractionResponse,
     StreamingInteractionResponse,
+    _iter_serialized,
 )
 
 if TYPE_CHECKING:
     from grpcvcr.cassette import Cassette
+    from grpcvcr.serialization import RpcType
+
+
+def _record_unary(cassette: Cassette, req: InteractionRequest, response: Any, rpc_type: RpcType) -> None:
+    """Wait for a live single-response call and record its outcome."""
+    try:
+        result = response.result()
+        response_bytes = result.SerializeToString()
+        response_type = type(result)
+        code = "OK"
+        details = None
+    except grpc.RpcError as e:
+        response_bytes = b""
+        response_type = None
+        code = e.code().name  # type: ignore[union-attr]
+        details = e.details()  # type: ignore[union-attr]
+
+    try:
+        trailing = response.trailing_metadata()
+    except Exception:
+        trailing = None
+
+    recorded_interaction = Interaction(
+        request=req,
+        response=InteractionResponse.from_grpc(
+            body=response_bytes,
+            code=code,
+            details=details,
+            trailing_metadata=trailing,
+            response_type=response_type,
+        ),
+        rpc_type=rpc_type,
+    )
+    cassette.record_interaction(recorded_interaction)
+
+
+def _record_streaming(
+    cassette: Cassette,
+    req: InteractionRequest,
+    response: Any,
+    rpc_type: RpcType,
+) -> _FakeStreamingCall:
+    """Drain a live streaming call, record it, and return a call replaying what it produced."""
+    received: list[Any] = []
+    code = "OK"
+    details = None
+
+    try:
+        for msg in response:
+            received.append(msg)
+    except grpc.RpcError as e:
+        code = e.code().name  # type: ignore[union-attr]
+        details = e.details()  # type: ignore[union-attr]
+
+    try:
+        trailing = response.trailing_metadata()
+    except Exception:
+        trailing = None
+
+    recorded_interaction = Interaction(
+        request=req,
+        response=StreamingInteractionResponse.from_grpc(
+            messages=_iter_serialized(received),
+            code=code,
+            details=details,
+            trailing_metadata=trailing,
+            response_type=type(received[0]) if received else None,
+        ),
+        rpc_type=rpc_type,
+    )
+    cassette.record_interaction(recorded_interaction)
+
+    # The live stream has been consumed, so replay the messages it produced.
+    return _FakeStreamingCall(
+        messages=received,
+        code=_STATUS_CODES[code],
+        details=details,
+        trailing_metadata=recorded_interaction.response.trailing_metadata_pairs(),
+    )
 
 
 class RecordingUnaryUnaryInterceptor(grpc.UnaryUnaryClientInterceptor):  # type: ignore[misc]
@@ -40,51 +123,17 @@ class RecordingUnaryUnaryInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         request_bytes = request.SerializeToString()
         metadata = client_call_details.metadata
 
-        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
-
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, request_bytes, metadata)
             if interaction is not None:
-                response_class = interaction.response.get_response_class()
-                if response_class:
-                    return create_unary_response(interaction, response_class.FromString)
-                return create_unary_response(interaction, type(request).FromString)
+                return create_unary_response(interaction, _playback_deserializer(interaction.response, type(request)))
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
         response = continuation(client_call_details, request)
-
-        try:
-            result = response.result()
-            response_bytes = result.SerializeToString()
-            response_type = type(result)
-            code = "OK"
-            details = None
-        except grpc.RpcError as e:
-            response_bytes = b""
-            response_type = None
-            code = e.code().name  # type: ignore[union-attr]
-            details = e.details()  # type: ignore[union-attr]
-
-        try:
-            trailing = response.trailing_metadata()
-        except Exception:
-            trailing = None
-
-        recorded_interaction = Interaction(
-            request=req,
-            response=InteractionResponse.from_grpc(
-                body=response_bytes,
-                code=code,
-                details=details,
-                trailing_metadata=trailing,
-                response_type=response_type,
-            ),
-            rpc_type="unary",
-        )
-        self.cassette.record_interaction(recorded_interaction)
-
+        _record_unary(self.cassette, req, response, "unary")
         return response
 
 
@@ -104,56 +153,19 @@ class RecordingUnaryStreamInterceptor(grpc.UnaryStreamClientInterceptor):  # typ
         request_bytes = request.SerializeToString()
         metadata = client_call_details.metadata
 
-        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
-
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, request_bytes, metadata)
             if interaction is not None:
-                response_class = interaction.response.get_response_class()
-                if response_class:
-                    return create_streaming_response(interaction, response_class.FromString)
-                return create_streaming_response(interaction, type(request).FromString)
+                return create_streaming_response(
+                    interaction, _playback_deserializer(interaction.response, type(request))
+                )
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, request_bytes, metadata)
         response = continuation(client_call_details, request)
-
-        messages: list[bytes] = []
-        response_type: type | None = None
-        code = "OK"
-        details = None
-
-        try:
-            for msg in response:
-                messages.append(msg.SerializeToString())
-                if response_type is None:
-                    response_type = type(msg)
-        except grpc.RpcError as e:
-            code = e.code().name  # type: ignore[union-attr]
-            details = e.details()  # type: ignore[union-attr]
-
-        try:
-            trailing = response.trailing_metadata()
-        except Exception:
-            trailing = None
-
-        recorded_interaction = Interaction(
-            request=req,
-            response=StreamingInteractionResponse.from_grpc(
-                messages=messages,
-                code=code,
-                details=details,
-                trailing_metadata=trailing,
-                response_type=response_type,
-            ),
-            rpc_type="server_streaming",
-        )
-        self.cassette.record_interaction(recorded_interaction)
-
-        response_class = recorded_interaction.response.get_response_class()
-        deserializer = response_class.FromString if response_class else type(request).FromString
-        return create_streaming_response(recorded_interaction, deserializer)
+        return _record_streaming(self.cassette, req, response, "server_streaming")
 
 
 class RecordingStreamUnaryInterceptor(grpc.StreamUnaryClientInterceptor):  # type: ignore[misc]
@@ -171,57 +183,21 @@ class RecordingStreamUnaryInterceptor(grpc.StreamUnaryClientInterceptor):  # typ
         method = client_call_details.method
         metadata = client_call_details.metadata
 
-        requests = list(request_iterator)
-        combined_request = b"".join(r.SerializeToString() for r in requests)
-
-        req = InteractionRequest.from_grpc(method, combined_request, metadata)
+        requests: list[Any] = list(request_iterator)
+        combined_request = b"".join(_iter_serialized(requests))
 
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, combined_request, metadata)
             if interaction is not None:
-                response_class = interaction.response.get_response_class()
-                if response_class:
-                    return create_unary_response(interaction, response_class.FromString)
-                msg_type = type(requests[0]) if requests else None
-                if msg_type:
-                    return create_unary_response(interaction, msg_type.FromString)
-                return create_unary_response(interaction, lambda x: x)
+                request_type = type(requests[0]) if requests else None
+                return create_unary_response(interaction, _playback_deserializer(interaction.response, request_type))
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, combined_request, metadata)
         response = continuation(client_call_details, iter(requests))
-
-        try:
-            result = response.result()
-            response_bytes = result.SerializeToString()
-            response_type = type(result)
-            code = "OK"
-            details = None
-        except grpc.RpcError as e:
-            response_bytes = b""
-            response_type = None
-            code = e.code().name  # type: ignore[union-attr]
-            details = e.details()  # type: ignore[union-attr]
-
-        try:
-            trailing = response.trailing_metadata()
-        except Exception:
-            trailing = None
-
-        recorded_interaction = Interaction(
-            request=req,
-            response=InteractionResponse.from_grpc(
-                body=response_bytes,
-                code=code,
-                details=details,
-                trailing_metadata=trailing,
-                response_type=response_type,
-            ),
-            rpc_type="client_streaming",
-        )
-        self.cassette.record_interaction(recorded_interaction)
-
+        _record_unary(self.cassette, req, response, "client_streaming")
         return response
 
 
@@ -240,65 +216,23 @@ class RecordingStreamStreamInterceptor(grpc.StreamStreamClientInterceptor):  # t
         method = client_call_details.method
         metadata = client_call_details.metadata
 
-        requests = list(request_iterator)
-        combined_request = b"".join(r.SerializeToString() for r in requests)
-
-        req = InteractionRequest.from_grpc(method, combined_request, metadata)
+        requests: list[Any] = list(request_iterator)
+        combined_request = b"".join(_iter_serialized(requests))
 
-        if self.cassette.record_mode != RecordMode.ALL:
-            interaction = self.cassette.find_interaction(req)
+        if self.cassette.record_mode is not _RECORD_ALL:
+            interaction = self.cassette.find_recorded(method, combined_request, metadata)
             if interaction is not None:
-                response_class = interaction.response.get_response_class()
-                if response_class:
-                    return create_streaming_response(interaction, response_class.FromString)
-                msg_type = type(requests[0]) if requests else None
-                deserializer = msg_type.FromString if msg_type else lambda x: x
-                return create_streaming_response(interaction, deserializer)
+                request_type = type(requests[0]) if requests else None
+                return create_streaming_response(
+                    interaction, _playback_deserializer(interaction.response, request_type)
+                )
 
         if not self.cassette.can_record:
             raise RecordingDisabledError(method)
 
+        req = InteractionRequest.from_grpc(method, combined_request, metadata)
         response = continuation(client_call_details, iter(requests))
-
-        messages: list[bytes] = []
-        response_type: type | None = None
-        code = "OK"
-        details = None
-
-        try:
-            for msg in response:
-                messages.append(msg.SerializeToString())
-                if response_type is None:
-                    response_type = type(msg)
-        except grpc.RpcError as e:
-            code = e.code().name  # type: ignore[union-attr]
-            details = e.details()  # type: ignore[union-attr]
-
-        try:
-            trailing = response.trailing_metadata()
-        except Exception:
-            trailing = None
-
-        recorded_interaction = Interaction(
-            request=req,
-            response=StreamingInteractionResponse.from_grpc(
-                messages=messages,
-                code=code,
-                details=details,
-                trailing_metadata=trailing,
-                response_type=response_type,
-            ),
-            rpc_type="bidi_streaming",
-        )
-        self.cassette.record_interaction(recorded_interaction)
-
-        response_class = recorded_interaction.response.get_response_class()
-        if response_class:
-            deserializer = response_class.FromString
-        else:
-            msg_type = type(requests[0]) if requests else None
-            deserializer = msg_type.FromString if msg_type else lambda x: x
-        return create_streaming_response(recorded_interaction, deserializer)
+        return _record_streaming(self.cassette, req, response, "bidi_streaming")
 
 
 def create_interceptors(cassette: Cassette) -> list[grpc.ClientInterceptor]:
@@ -310,9 +244,13 @@ def create_interceptors(cassette: Cassette) -> list[grpc.ClientInterceptor]:
     Returns:
         List of interceptors covering all RPC types.
     """
-    return [
-        RecordingUnaryUnaryInterceptor(cassette),
-        RecordingUnaryStreamInterceptor(cassette),
-        RecordingStreamUnaryInterceptor(cassette),
-        RecordingStreamStreamInterceptor(cassette),
-    ]
+    interceptors = cassette._interceptors
+    if interceptors is None:
+        # The interceptors only hold the cassette, so every channel can share one set.
+        interceptors = cassette._interceptors = (
+            RecordingUnaryUnaryInterceptor(cassette),
+            RecordingUnaryStreamInterceptor(cassette),
+            RecordingStreamUnaryInterceptor(cassette),
+            RecordingStreamStreamInterceptor(cassette),
+        )
+    return list(interceptors)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
 
 from grpcvcr.serialization import Interaction, InteractionRequest
@@ -41,6 +41,23 @@ class Matcher(ABC):
         """
         ...
 
+    def index_key(self, request: InteractionRequest) -> Hashable | None:
+        """Return a hashable key that every matching request shares.
+
+        Cassettes use this to index recorded interactions so lookups only
+        run `matches` against candidates with an equal key. Two requests
+        that match must have equal keys. A matcher returns `None` for every
+        request when it cannot be keyed, which makes lookups fall back to a
+        linear scan.
+
+        Args:
+            request: The request to compute a key for.
+
+        Returns:
+            A hashable key, or None if this matcher cannot be indexed.
+        """
+        return None
+
     def __and__(self, other: Matcher) -> AllMatcher:
         """Combine this matcher with another using AND logic.
 
@@ -55,8 +72,6 @@ class Matcher(ABC):
             matcher = MethodMatcher() & RequestMatcher()
             ```
         """
-        if isinstance(self, AllMatcher):
-            return AllMatcher(matchers=[*self.matchers, other])
         return AllMatcher(matchers=[self, other])
 
 
@@ -82,6 +97,16 @@ class MethodMatcher(Matcher):
         """Check if method paths match exactly."""
         return request.method == recorded.method
 
+    def index_key(self, request: InteractionRequest) -> Hashable | None:
+        """Key requests by method path.
+
+        Subclasses that override `matches` may accept other paths, so they
+        are not indexed unless they also override this method.
+        """
+        if type(self).matches is not MethodMatcher.matches:
+            return None
+        return request.method
+
 
 @dataclass
 class MetadataMatcher(Matcher):
@@ -121,13 +146,18 @@ class MetadataMatcher(Matcher):
                     return False
             return True
 
-        ignore = set(self.ignore_keys or [])
-        all_keys = set(req_meta.keys()) | set(rec_meta.keys())
+        if not self.ignore_keys:
+            return req_meta == rec_meta
 
-        for key in all_keys:
-            if key in ignore:
-                continue
-            if req_meta.get(key) != rec_meta.get(key):
+        # Walk each side once instead of building the union of both key sets.
+        # Ignore lists hold a handful of keys, so scanning the list beats
+        # building a set on every call.
+        ignore = self.ignore_keys
+        for key, values in req_meta.items():
+            if key not in ignore and rec_meta.get(key) != values:
+                return False
+        for key in rec_meta:
+            if key not in ignore and key not in req_meta:
                 return False
 
         return True
@@ -153,7 +183,20 @@ class RequestMatcher(Matcher):
         recorded: InteractionRequest,
     ) -> bool:
         """Check if request bodies match exactly."""
-        return request.body == recorded.body
+        body, recorded_body = request.body, recorded.body
+        # String hashes are cached on the object, so comparing them first
+        # rejects most mismatches without scanning either body.
+        return hash(body) == hash(recorded_body) and body == recorded_body
+
+    def index_key(self, request: InteractionRequest) -> Hashable | None:
+        """Key requests by body.
+
+        Subclasses that override `matches` may accept other bodies, so they
+        are not indexed unless they also override this method.
+        """
+        if type(self).matches is not RequestMatcher.matches:
+            return None
+        return request.body
 
 
 @dataclass
@@ -161,7 +204,8 @@ class CustomMatcher(Matcher):
     """Matches requests using a custom function.
 
     Useful for complex matching logic like comparing specific protobuf
-    fields or implementing fuzzy matching.
+    fields or implementing fuzzy matching. `get_body_bytes` caches the
+    decoded body on each request, so calling it on every comparison is cheap.
 
     Example:
         ```python
@@ -208,13 +252,28 @@ class AllMatcher(Matcher):
     matchers: list[Matcher] = field(default_factory=list)
     """List of matchers that must all succeed."""
 
+    def __post_init__(self) -> None:
+        # Inline nested AllMatchers so matching never recurses through them.
+        if any(isinstance(m, AllMatcher) for m in self.matchers):
+            self.matchers = [
+                child for m in self.matchers for child in (m.matchers if isinstance(m, AllMatcher) else (m,))
+            ]
+
     def matches(
         self,
         request: InteractionRequest,
         recorded: InteractionRequest,
     ) -> bool:
         """Check if all contained matchers succeed."""
-        return all(m.matches(request, recorded) for m in self.matchers)
+        for matcher in self.matchers:
+            if not matcher.matches(request, recorded):
+                return False
+        return True
+
+    def index_key(self, request: InteractionRequest) -> Hashable | None:
+        """Combine the keys of all contained matchers that can be indexed."""
+        keys = tuple(key for key in (m.index_key(request) for m in self.matchers) if key is not None)
+        return keys or None
 
 
 DEFAULT_MATCHER = MethodMatcher()
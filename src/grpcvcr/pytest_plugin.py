@@ -30,6 +30,10 @@ if TYPE_CHECKING:
     from _pytest.fixtures import FixtureRequest
 
 
+_MARKER_KEY = pytest.StashKey["pytest.Mark | None"]()
+_POOL_KEY = pytest.StashKey["dict[Path, Cassette]"]()
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add grpcvcr command line options to pytest."""
     group = parser.getgroup("grpcvcr")
@@ -54,11 +58,20 @@ def pytest_configure(config: Config) -> None:
         "markers",
         "grpcvcr(cassette, record_mode, match_on): Mark test to use a specific cassette configuration",
     )
+    config.stash[_POOL_KEY] = {}
 
 
-@pytest.fixture
+def _get_grpcvcr_marker(request: FixtureRequest) -> pytest.Mark | None:
+    """Get the closest grpcvcr marker for a test, resolving it once per test."""
+    node = request.node
+    if _MARKER_KEY not in node.stash:
+        node.stash[_MARKER_KEY] = node.get_closest_marker("grpcvcr")
+    return node.stash[_MARKER_KEY]
+
+
+@pytest.fixture(scope="session")
 def grpcvcr_cassette_dir(request: FixtureRequest) -> Path:
-    """Get the cassette directory for the current test."""
+    """Get the cassette directory, resolved once per test session."""
     return Path(request.config.getoption("--grpcvcr-cassette-dir"))
 
 
@@ -75,7 +88,7 @@ def grpcvcr_record_mode(request: FixtureRequest) -> RecordMode:
     if cli_mode:
         return RecordMode(cli_mode)
 
-    marker = request.node.get_closest_marker("grpcvcr")
+    marker = _get_grpcvcr_marker(request)
     if marker and "record_mode" in marker.kwargs:
         mode = marker.kwargs["record_mode"]
         if isinstance(mode, RecordMode):
@@ -96,6 +109,11 @@ def grpcvcr_cassette(
     The cassette path is derived from the test name by default,
     or can be specified via the @pytest.mark.grpcvcr marker.
 
+    Tests that resolve to the same cassette file share one Cassette
+    instance, so it is loaded only once. A test whose record mode or
+    matcher differs from the pooled one gets a fresh Cassette instead.
+    The cassette is saved after every test.
+
     Example:
         ```python
         def test_my_feature(grpcvcr_cassette):
@@ -118,7 +136,7 @@ def grpcvcr_cassette(
             ...
         ```
     """
-    marker = request.node.get_closest_marker("grpcvcr")
+    marker = _get_grpcvcr_marker(request)
 
     if marker and marker.args:
         cassette_name = marker.args[0]
@@ -133,11 +151,17 @@ def grpcvcr_cassette(
     if marker and "match_on" in marker.kwargs:
         match_on = marker.kwargs["match_on"]
 
-    cassette = Cassette(
-        path=cassette_path,
-        record_mode=grpcvcr_record_mode,
-        match_on=match_on,
-    )
+    pool = request.config.stash[_POOL_KEY]
+    key = cassette_path.resolve()
+    cassette = pool.get(key)
+    if cassette is None or cassette.record_mode is not grpcvcr_record_mode or cassette.match_on != match_on:
+        # Earlier tests saved on teardown, so a fresh load sees their recordings.
+        cassette = Cassette(
+            path=cassette_path,
+            record_mode=grpcvcr_record_mode,
+            match_on=match_on,
+        )
+        pool[key] = cassette
 
     try:
         yield cassette
@@ -33,7 +33,7 @@ class RecordMode(Enum):
     Default mode - good for iterative test development."""
 
     ALL = "all"
-    """Always record, overwriting existing interactions.
+    """Always record into a fresh cassette, replacing the existing file.
     Use to refresh cassettes after API changes."""
 
     ONCE = "once"
@@ -2,25 +2,218 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import importlib
+import io
+import itertools
 import json
+import mmap
+import os
+import struct
 import sys
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Literal, cast
 
 import yaml
 
+from grpcvcr import _cassette_pb
 from grpcvcr.errors import SerializationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover
+    pybase64 = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+def _b64encode(data: bytes | memoryview) -> str:
+    """Base64-encode bytes to text, using pybase64's SIMD codec when installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    """Decode base64 text to bytes, using pybase64's SIMD codec when installed."""
+    if pybase64 is not None:
+        return pybase64.b64decode(text, validate=False)
+    return binascii.a2b_base64(text)
+
+
+def _b64encode_all(messages: Iterable[bytes]) -> list[str]:
+    """Base64-encode a sequence of messages, choosing the codec once for the batch."""
+    if pybase64 is not None:
+        return list(map(pybase64.b64encode_as_string, messages))
+    b2a = binascii.b2a_base64
+    return [b2a(m, newline=False).decode("ascii") for m in messages]
+
+
+def _b64decode_all(texts: Iterable[str]) -> list[bytes]:
+    """Decode a sequence of base64 texts, choosing the codec once for the batch."""
+    if pybase64 is not None:
+        decode = pybase64.b64decode
+        return [decode(t, validate=False) for t in texts]
+    return list(map(binascii.a2b_base64, texts))
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(
+    data: Any,
+    *,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Both backends produce the same bytes: compact separators by default, or
+    two-space indentation when `indent` is set. `default` converts objects
+    neither backend handles natively; dataclasses are routed through it too.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=default).encode("utf-8")
+
+
+_FRAME_PREFIX = struct.Struct("<I")
+"""Little-endian uint32 length prefix written before each binary cassette frame."""
+
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+"""Binary and YAML cassettes at least this many bytes are loaded through `mmap`."""
+
+RpcType = Literal["unary", "server_streaming", "client_streaming", "bidi_streaming"]
+"""The kinds of gRPC call an interaction can record."""
+
+_STREAMING_RPC_TYPES = frozenset({"server_streaming", "bidi_streaming"})
+"""RPC types whose recorded response is a `StreamingInteractionResponse`."""
+
+
+def _intern(value: str | bytes) -> str:
+    """Intern a method path or metadata key so duplicates share one object.
+
+    grpc.aio reports method paths as bytes, and older cassettes recorded
+    through it stored them that way. They are decoded so every format
+    stores and matches the same text path.
+    """
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    return sys.intern(value)
+
+
+def _value_list(values: Sequence[str] | str | bytes) -> list[str]:
+    """Copy one key's metadata values, wrapping a bare value in a list."""
+    if isinstance(values, str | bytes):
+        return [values]  # type: ignore[list-item]
+    return list(values)
+
+
+def _group_metadata(
+    metadata: Mapping[str, Sequence[str]] | Iterable[tuple[str, str]] | None,
+    *,
+    intern_keys: bool = False,
+) -> dict[str, list[str]]:
+    """Group gRPC metadata into a dict of key to values, preserving order.
+
+    Accepts either (key, value) tuples as gRPC provides them, or a mapping
+    that is already grouped, in which case only the value lists are copied.
+    A single string value in a mapping is taken as one value, not split
+    into characters.
+    """
+    if not metadata:
+        return {}
+    intern = _intern if intern_keys else None
+    if isinstance(metadata, Mapping):
+        items = cast("Mapping[str, Sequence[str]]", metadata).items()
+        if intern is None:
+            return {key: _value_list(values) for key, values in items}
+        return {intern(key): _value_list(values) for key, values in items}
+
+    pairs = metadata if isinstance(metadata, tuple | list) else tuple(metadata)
+    # Repeated keys are rare, so build single-value lists in one pass and only
+    # regroup when some key collapsed into another.
+    if intern is None:
+        grouped = {key: [value] for key, value in pairs}
+    else:
+        grouped = {intern(key): [value] for key, value in pairs}
+    if len(grouped) == len(pairs):
+        return grouped
+
+    grouped = {}
+    for key, value in pairs:
+        if intern is not None:
+            key = intern(key)
+        values = grouped.get(key)
+        if values is None:
+            grouped[key] = [value]
+        else:
+            values.append(value)
+    return grouped
+
+
+def _metadata_pairs(metadata: Mapping[str, Sequence[str]]) -> tuple[tuple[str, str], ...]:
+    """Flatten grouped metadata back into the (key, value) tuples gRPC uses."""
+    return tuple([(key, value) for key, values in metadata.items() for value in values])
+
+
+def _metadata_to_pb(metadata: dict[str, list[str]], entries: Any) -> None:
+    """Copy a metadata dict into a repeated `MetadataEntry` protobuf field."""
+    for key, values in metadata.items():
+        entries.add(key=key, values=values)
+
+
+def _metadata_from_pb(entries: Any) -> dict[str, list[str]]:
+    """Build a metadata dict from a repeated `MetadataEntry` protobuf field."""
+    return {_intern(entry.key): list(entry.values) for entry in entries}
+
+
+def _iter_serialized(messages: Iterable[Any]) -> Iterator[bytes]:
+    """Serialize protobuf messages one at a time.
+
+    `SerializeToString` is looked up once per run of same-typed messages
+    rather than once per message, which matters for long streams.
+    """
+    for message_type, run in itertools.groupby(messages, type):
+        yield from map(message_type.SerializeToString, run)
+
+
+_MODULE_PATH_CACHE: dict[type, str] = {}
+"""Importable paths already resolved by `_get_importable_module_path`."""
+
+_CLASS_CACHE: dict[str, type] = {}
+"""Classes already loaded by `_load_class`, keyed by their fully qualified path."""
+
 
 def _get_importable_module_path(cls: type) -> str:
     """Get the actual importable module path for a class.
 
     Protobuf-generated classes report their __module__ as the proto file name,
     not the actual Python module path. This function finds the real importable
-    path by searching sys.modules.
+    path by checking the reported module first and then searching
+    sys.modules. Successful lookups are cached, since the same response
+    classes are recorded over and over.
 
     Args:
         cls: The class to find the module path for.
@@ -28,15 +221,31 @@ def _get_importable_module_path(cls: type) -> str:
     Returns:
         The fully qualified class path that can be used with importlib.
     """
+    cached = _MODULE_PATH_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
     class_name = cls.__name__
     reported_module = cls.__module__
 
+    # The reported module (or its generated `_pb2` sibling) almost always holds
+    # the class, so probe those before falling back to a full scan.
+    for module_name in (reported_module, f"{reported_module}_pb2"):
+        module = sys.modules.get(module_name)
+        try:
+            if module is not None and getattr(module, class_name, None) is cls:
+                path = _MODULE_PATH_CACHE[cls] = f"{module_name}.{class_name}"
+                return path
+        except Exception:
+            continue
+
     for module_name, module in sys.modules.items():
         if module is None:
             continue
         try:
             if getattr(module, class_name, None) is cls:
-                return f"{module_name}.{class_name}"
+                path = _MODULE_PATH_CACHE[cls] = f"{module_name}.{class_name}"
+                return path
         except Exception:
             continue
 
@@ -56,13 +265,33 @@ def _load_class(type_path: str) -> type:
         ModuleNotFoundError: If the module cannot be imported.
         AttributeError: If the class doesn't exist in the module.
     """
-    module_path, class_name = type_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    return getattr(module, class_name)
+    cls = _CLASS_CACHE.get(type_path)
+    if cls is None:
+        module_path, class_name = type_path.rsplit(".", 1)
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        cls = _CLASS_CACHE[type_path] = getattr(module, class_name)
+    return cls
+
+
+class _RequestCache:
+    """Slot for `InteractionRequest`'s decoded body, kept out of its dataclass fields."""
+
+    __slots__ = ("_body_bytes",)
+
+    _body_bytes: tuple[str, bytes] | None
 
 
-@dataclass
-class InteractionRequest:
+class _ResponseCache:
+    """Slots for the response records' replay caches, kept out of their dataclass fields."""
+
+    __slots__ = ("_decoded", "_trailing_pairs")
+
+    _decoded: tuple[Any, Callable[[bytes], Any], Any] | None
+    _trailing_pairs: tuple[dict[str, list[str]], tuple[tuple[str, str], ...]] | None
+
+
+@dataclass(slots=True)
+class InteractionRequest(_RequestCache):
     """Recorded gRPC request.
 
     Stores all information needed to match and replay a gRPC request,
@@ -87,19 +316,23 @@ class InteractionRequest:
     metadata: dict[str, list[str]] = field(default_factory=dict)
     """Request metadata as a dict mapping header names to lists of values."""
 
+    def __post_init__(self) -> None:
+        self._body_bytes = None
+
     @classmethod
     def from_grpc(
         cls,
         method: str,
-        body: bytes,
-        metadata: tuple[tuple[str, str], ...] | None = None,
+        body: bytes | memoryview,
+        metadata: Mapping[str, Sequence[str]] | Iterable[tuple[str, str]] | None = None,
     ) -> InteractionRequest:
         """Create an InteractionRequest from gRPC call details.
 
         Args:
             method: Full gRPC method path.
-            body: Raw protobuf bytes.
-            metadata: Optional request metadata as tuples of (key, value).
+            body: Raw protobuf bytes, or a memoryview over them.
+            metadata: Optional request metadata as tuples of (key, value),
+                or a mapping of key to values.
 
         Returns:
             A new InteractionRequest instance.
@@ -113,28 +346,68 @@ class InteractionRequest:
             )
             ```
         """
-        meta_dict: dict[str, list[str]] = {}
-        if metadata:
-            for key, value in metadata:
-                meta_dict.setdefault(key, []).append(value)
+        meta_dict = _group_metadata(metadata, intern_keys=True)
 
-        return cls(
-            method=method,
-            body=base64.b64encode(body).decode("ascii"),
-            metadata=meta_dict,
-        )
+        # Fill the slots directly; the generated __init__ only re-assigns them.
+        request = object.__new__(cls)
+        request.method = _intern(method)
+        request.body = _b64encode(body)
+        request.metadata = meta_dict
+        # Keep raw bytes for get_body_bytes; a memoryview is not kept, so it never pins its buffer.
+        request._body_bytes = (request.body, body) if isinstance(body, bytes) else None
+        return request
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for serialization.
+
+        Returns:
+            Dictionary with 'method', 'body', and 'metadata' keys.
+        """
+        return {
+            "method": self.method,
+            "body": self.body,
+            "metadata": {key: list(values) for key, values in self.metadata.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InteractionRequest:
+        """Create an InteractionRequest from a dictionary.
+
+        Args:
+            data: Dictionary produced by `to_dict`.
+
+        Returns:
+            A new InteractionRequest instance.
+        """
+        # Cassettes are loaded in bulk, so skip the generated __init__ and fill
+        # the slots directly, as from_grpc does.
+        request = object.__new__(cls)
+        request.method = _intern(data["method"])
+        request.body = data["body"]
+        metadata = data.get("metadata")
+        request.metadata = {_intern(key): values for key, values in metadata.items()} if metadata else {}
+        request._body_bytes = None
+        return request
 
     def get_body_bytes(self) -> bytes:
         """Decode the body back to raw protobuf bytes.
 
+        The result is cached until `body` is reassigned, so custom matchers
+        can call this for every comparison without decoding again.
+
         Returns:
             The original protobuf bytes.
         """
-        return base64.b64decode(self.body)
+        cached = self._body_bytes
+        if cached is not None and cached[0] is self.body:
+            return cached[1]
+        data = _b64decode(self.body)
+        self._body_bytes = (self.body, data)
+        return data
 
 
-@dataclass
-class InteractionResponse:
+@dataclass(slots=True)
+class InteractionResponse(_ResponseCache):
     """Recorded gRPC unary response.
 
     Stores the response body, status code, and metadata for replay.
@@ -155,13 +428,17 @@ class InteractionResponse:
     response_type: str | None = None
     """Fully qualified response class name for deserialization (e.g., 'mypackage.pb2.GetUserResponse')."""
 
+    def __post_init__(self) -> None:
+        self._decoded = None
+        self._trailing_pairs = None
+
     @classmethod
     def from_grpc(
         cls,
         body: bytes,
         code: str,
         details: str | None = None,
-        trailing_metadata: tuple[tuple[str, str], ...] | None = None,
+        trailing_metadata: Mapping[str, Sequence[str]] | Iterable[tuple[str, str]] | None = None,
         response_type: type | None = None,
     ) -> InteractionResponse:
         """Create an InteractionResponse from gRPC response data.
@@ -170,36 +447,105 @@ class InteractionResponse:
             body: Raw protobuf response bytes.
             code: gRPC status code name.
             details: Optional error details.
-            trailing_metadata: Optional trailing metadata as tuples.
+            trailing_metadata: Optional trailing metadata as tuples, or a
+                mapping of key to values.
             response_type: Optional response class for later deserialization.
 
         Returns:
             A new InteractionResponse instance.
         """
-        meta_dict: dict[str, list[str]] = {}
-        if trailing_metadata:
-            for key, value in trailing_metadata:
-                meta_dict.setdefault(key, []).append(value)
+        meta_dict = _group_metadata(trailing_metadata)
 
         type_str = None
         if response_type is not None:
             type_str = _get_importable_module_path(response_type)
 
         return cls(
-            body=base64.b64encode(body).decode("ascii"),
+            body=_b64encode(body),
             code=code,
             details=details,
             trailing_metadata=meta_dict,
             response_type=type_str,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for serialization.
+
+        Returns:
+            Dictionary with one key per field.
+        """
+        return {
+            "body": self.body,
+            "code": self.code,
+            "details": self.details,
+            "trailing_metadata": {key: list(values) for key, values in self.trailing_metadata.items()},
+            "response_type": self.response_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InteractionResponse:
+        """Create an InteractionResponse from a dictionary.
+
+        Args:
+            data: Dictionary produced by `to_dict`.
+
+        Returns:
+            A new InteractionResponse instance.
+        """
+        response = object.__new__(cls)
+        response.body = data["body"]
+        response.code = data["code"]
+        response.details = data.get("details")
+        response.trailing_metadata = data.get("trailing_metadata") or {}
+        response.response_type = data.get("response_type")
+        response._decoded = None
+        response._trailing_pairs = None
+        return response
+
     def get_body_bytes(self) -> bytes:
         """Decode the body back to raw protobuf bytes.
 
         Returns:
             The original protobuf bytes.
         """
-        return base64.b64decode(self.body)
+        return _b64decode(self.body)
+
+    def deserialize(self, deserializer: Callable[[bytes], Any]) -> Any:
+        """Deserialize the body, reusing the result of an earlier call.
+
+        Replaying the same interaction repeatedly parses the body only once.
+        The returned message is shared between replays, so treat it as
+        read-only.
+
+        Args:
+            deserializer: Function to deserialize the body bytes
+                (typically `SomeProtoMessage.FromString`).
+
+        Returns:
+            The deserialized response message.
+        """
+        cached = self._decoded
+        if cached is not None and cached[0] is self.body and cached[1] == deserializer:
+            return cached[2]
+        result = deserializer(self.get_body_bytes())
+        self._decoded = (self.body, deserializer, result)
+        return result
+
+    def trailing_metadata_pairs(self) -> tuple[tuple[str, str], ...]:
+        """Return the trailing metadata as the (key, value) tuples gRPC uses.
+
+        The tuple is built once and shared between replays until
+        `trailing_metadata` is reassigned.
+
+        Returns:
+            The flattened trailing metadata.
+        """
+        cached = self._trailing_pairs
+        if cached is not None and cached[0] is self.trailing_metadata:
+            return cached[1]
+        pairs = _metadata_pairs(self.trailing_metadata)
+        self._trailing_pairs = (self.trailing_metadata, pairs)
+        return pairs
 
     def get_response_class(self) -> type | None:
         """Load and return the response protobuf class.
@@ -215,8 +561,8 @@ class InteractionResponse:
         return _load_class(self.response_type)
 
 
-@dataclass
-class StreamingInteractionResponse:
+@dataclass(slots=True)
+class StreamingInteractionResponse(_ResponseCache):
     """Recorded gRPC streaming response.
 
     Stores multiple response messages for server-streaming or
@@ -238,51 +584,156 @@ class StreamingInteractionResponse:
     response_type: str | None = None
     """Fully qualified response message class name."""
 
+    def __post_init__(self) -> None:
+        self._decoded = None
+        self._trailing_pairs = None
+
     @classmethod
     def from_grpc(
         cls,
-        messages: list[bytes],
+        messages: Iterable[bytes],
         code: str,
         details: str | None = None,
-        trailing_metadata: tuple[tuple[str, str], ...] | None = None,
+        trailing_metadata: Mapping[str, Sequence[str]] | Iterable[tuple[str, str]] | None = None,
         response_type: type | None = None,
     ) -> StreamingInteractionResponse:
         """Create a StreamingInteractionResponse from gRPC streaming data.
 
         Args:
-            messages: List of raw protobuf message bytes.
+            messages: Raw protobuf message bytes. An iterator is encoded one
+                message at a time, so the raw bytes are never all held at once.
             code: gRPC status code name.
             details: Optional error details.
-            trailing_metadata: Optional trailing metadata as tuples.
+            trailing_metadata: Optional trailing metadata as tuples, or a
+                mapping of key to values.
             response_type: Optional response message class.
 
         Returns:
             A new StreamingInteractionResponse instance.
         """
-        meta_dict: dict[str, list[str]] = {}
-        if trailing_metadata:
-            for key, value in trailing_metadata:
-                meta_dict.setdefault(key, []).append(value)
+        meta_dict = _group_metadata(trailing_metadata)
 
         type_str = None
         if response_type is not None:
             type_str = _get_importable_module_path(response_type)
 
         return cls(
-            messages=[base64.b64encode(m).decode("ascii") for m in messages],
+            messages=_b64encode_all(messages),
             code=code,
             details=details,
             trailing_metadata=meta_dict,
             response_type=type_str,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for serialization.
+
+        Returns:
+            Dictionary with one key per field.
+        """
+        return {
+            "messages": list(self.messages),
+            "code": self.code,
+            "details": self.details,
+            "trailing_metadata": {key: list(values) for key, values in self.trailing_metadata.items()},
+            "response_type": self.response_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StreamingInteractionResponse:
+        """Create a StreamingInteractionResponse from a dictionary.
+
+        Args:
+            data: Dictionary produced by `to_dict`.
+
+        Returns:
+            A new StreamingInteractionResponse instance.
+        """
+        response = object.__new__(cls)
+        response.messages = data["messages"]
+        response.code = data["code"]
+        response.details = data.get("details")
+        response.trailing_metadata = data.get("trailing_metadata") or {}
+        response.response_type = data.get("response_type")
+        response._decoded = None
+        response._trailing_pairs = None
+        return response
+
     def get_messages_bytes(self) -> list[bytes]:
         """Decode all messages back to raw protobuf bytes.
 
         Returns:
             List of original protobuf bytes.
         """
-        return [base64.b64decode(m) for m in self.messages]
+        return _b64decode_all(self.messages)
+
+    def deserialize_messages(self, deserializer: Callable[[bytes], Any]) -> list[Any]:
+        """Deserialize all messages, reusing the result of an earlier call.
+
+        Replaying the same interaction repeatedly parses the messages only
+        once. The returned list and messages are shared between replays, so
+        treat them as read-only.
+
+        Args:
+            deserializer: Function to deserialize each message
+                (typically `SomeProtoMessage.FromString`).
+
+        Returns:
+            The deserialized response messages, in order.
+        """
+        cached = self._decoded
+        if cached is not None and cached[0] is self.messages and cached[1] == deserializer:
+            return cached[2]
+        result = [deserializer(m) for m in self.get_messages_bytes()]
+        self._decoded = (self.messages, deserializer, result)
+        return result
+
+    def iter_messages(self, deserializer: Callable[[bytes], Any]) -> Iterator[Any]:
+        """Iterate over deserialized messages, parsing each one only when reached.
+
+        A consumer that stops early never pays for the rest of the stream.
+        Once an iteration runs to completion its results are cached as in
+        `deserialize_messages`, and later calls iterate the cached list.
+
+        Args:
+            deserializer: Function to deserialize each message
+                (typically `SomeProtoMessage.FromString`).
+
+        Returns:
+            An iterator over the deserialized response messages, in order.
+        """
+        cached = self._decoded
+        if cached is not None and cached[0] is self.messages and cached[1] == deserializer:
+            return iter(cached[2])
+        return self._decode_lazily(deserializer)
+
+    def _decode_lazily(self, deserializer: Callable[[bytes], Any]) -> Iterator[Any]:
+        """Yield deserialized messages, caching the full list once exhausted."""
+        messages = self.messages
+        decoded: list[Any] = []
+        append = decoded.append
+        for text in messages:
+            # Decode per message so a consumer that stops early skips the rest.
+            message = deserializer(_b64decode(text))
+            append(message)
+            yield message
+        self._decoded = (messages, deserializer, decoded)
+
+    def trailing_metadata_pairs(self) -> tuple[tuple[str, str], ...]:
+        """Return the trailing metadata as the (key, value) tuples gRPC uses.
+
+        The tuple is built once and shared between replays until
+        `trailing_metadata` is reassigned.
+
+        Returns:
+            The flattened trailing metadata.
+        """
+        cached = self._trailing_pairs
+        if cached is not None and cached[0] is self.trailing_metadata:
+            return cached[1]
+        pairs = _metadata_pairs(self.trailing_metadata)
+        self._trailing_pairs = (self.trailing_metadata, pairs)
+        return pairs
 
     def get_response_class(self) -> type | None:
         """Load and return the response protobuf class.
@@ -295,7 +746,7 @@ class StreamingInteractionResponse:
         return _load_class(self.response_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """A single recorded gRPC interaction (request + response pair).
 
@@ -308,7 +759,7 @@ class Interaction:
     response: InteractionResponse | StreamingInteractionResponse
     """The recorded response (unary or streaming)."""
 
-    rpc_type: Literal["unary", "server_streaming", "client_streaming", "bidi_streaming"]
+    rpc_type: RpcType
     """The type of RPC call."""
 
     @property
@@ -323,8 +774,8 @@ class Interaction:
             Dictionary representation suitable for YAML/JSON serialization.
         """
         return {
-            "request": asdict(self.request),
-            "response": asdict(self.response),
+            "request": self.request.to_dict(),
+            "response": self.response.to_dict(),
             "rpc_type": self.rpc_type,
         }
 
@@ -339,17 +790,88 @@ class Interaction:
             A new Interaction instance.
         """
         rpc_type = data["rpc_type"]
-        request = InteractionRequest(**data["request"])
+        response_cls = StreamingInteractionResponse if rpc_type in _STREAMING_RPC_TYPES else InteractionResponse
+
+        interaction = object.__new__(cls)
+        interaction.request = InteractionRequest.from_dict(data["request"])
+        interaction.response = response_cls.from_dict(data["response"])
+        interaction.rpc_type = rpc_type
+        return interaction
+
+    def to_pb(self) -> bytes:
+        """Encode as a binary cassette frame payload.
 
-        if rpc_type in ("server_streaming", "bidi_streaming"):
-            response = StreamingInteractionResponse(**data["response"])
+        Bodies are stored as raw bytes rather than base64 text.
+
+        Returns:
+            The serialized protobuf message.
+        """
+        message = _cassette_pb.Interaction(rpc_type=self.rpc_type)
+        pb_request = message.request
+        pb_request.method = self.request.method
+        pb_request.body = self.request.get_body_bytes()
+        _metadata_to_pb(self.request.metadata, pb_request.metadata)
+
+        response = self.response
+        pb_response = message.response
+        pb_response.code = response.code
+        if isinstance(response, StreamingInteractionResponse):
+            pb_response.messages.extend(response.get_messages_bytes())
         else:
-            response = InteractionResponse(**data["response"])
+            pb_response.body = response.get_body_bytes()
+        if response.details is not None:
+            pb_response.details = response.details
+        _metadata_to_pb(response.trailing_metadata, pb_response.trailing_metadata)
+        if response.response_type is not None:
+            pb_response.response_type = response.response_type
+        return message.SerializeToString()
+
+    @classmethod
+    def from_pb(cls, payload: bytes) -> Interaction:
+        """Decode a binary cassette frame payload.
+
+        Args:
+            payload: Serialized protobuf message produced by `to_pb`.
+
+        Returns:
+            A new Interaction instance.
+        """
+        message = _cassette_pb.Interaction.FromString(payload)
+        pb_request = message.request
+        pb_response = message.response
+        rpc_type = message.rpc_type
+
+        request = InteractionRequest(
+            method=_intern(pb_request.method),
+            body=_b64encode(pb_request.body),
+            metadata=_metadata_from_pb(pb_request.metadata),
+        )
+        details = pb_response.details if pb_response.HasField("details") else None
+        response_type = pb_response.response_type if pb_response.HasField("response_type") else None
+        trailing_metadata = _metadata_from_pb(pb_response.trailing_metadata)
+
+        response: InteractionResponse | StreamingInteractionResponse
+        if rpc_type in _STREAMING_RPC_TYPES:
+            response = StreamingInteractionResponse(
+                messages=_b64encode_all(pb_response.messages),
+                code=pb_response.code,
+                details=details,
+                trailing_metadata=trailing_metadata,
+                response_type=response_type,
+            )
+        else:
+            response = InteractionResponse(
+                body=_b64encode(pb_response.body),
+                code=pb_response.code,
+                details=details,
+                trailing_metadata=trailing_metadata,
+                response_type=response_type,
+            )
 
         return cls(request=request, response=response, rpc_type=rpc_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class CassetteData:
     """Complete cassette file contents.
 
@@ -390,7 +912,7 @@ class CassetteData:
 
 
 class CassetteSerializer:
-    """Handles cassette file serialization to YAML or JSON.
+    """Handles cassette file serialization to YAML, JSON, JSON Lines, or binary protobuf.
 
     Example:
         ```python
@@ -407,7 +929,9 @@ class CassetteSerializer:
         """Load cassette data from a file.
 
         The format is determined by file extension: `.json` for JSON,
-        anything else (including `.yaml`, `.yml`) for YAML.
+        `.jsonl` for JSON Lines, `.pb` for length-prefixed protobuf frames,
+        anything else (including `.yaml`, `.yml`) for YAML. Large binary and
+        YAML cassettes are read through a memory map.
 
         Args:
             path: Path to the cassette file.
@@ -422,25 +946,104 @@ class CassetteSerializer:
         if not path.exists():
             raise FileNotFoundError(path)
 
-        content = path.read_text(encoding="utf-8")
+        if path.suffix not in (".json", ".jsonl") and path.stat().st_size >= _MMAP_THRESHOLD:
+            return CassetteSerializer._load_mapped(path)
+
+        content = path.read_bytes()
 
         try:
+            if path.suffix == ".pb":
+                return CassetteSerializer._load_pb(content)
+            if path.suffix == ".jsonl":
+                return CassetteSerializer._load_jsonl(content)
             if path.suffix == ".json":
-                data = json.loads(content)
+                data = _json_loads(content)
             else:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YamlLoader)
         except Exception as e:
             raise SerializationError(f"Failed to parse {path}", e) from e
 
+        return CassetteSerializer._from_document(path, data)
+
+    @staticmethod
+    def _load_mapped(path: Path) -> CassetteData:
+        """Load a large binary or YAML cassette through a read-only memory map.
+
+        libyaml pulls from the map in chunks and binary frames are sliced out
+        of it, so the file is never copied into one large bytes object.
+        """
+        try:
+            with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if path.suffix == ".pb":
+                    return CassetteSerializer._load_pb(mapped)
+                data = yaml.load(mapped, Loader=_YamlLoader)
+        except Exception as e:
+            raise SerializationError(f"Failed to parse {path}", e) from e
+
+        return CassetteSerializer._from_document(path, data)
+
+    @staticmethod
+    def _from_document(path: Path, data: Any) -> CassetteData:
+        """Build cassette data from a parsed YAML or JSON document."""
+        if data is None:
+            raise SerializationError(f"Failed to parse {path}: the cassette is empty")
         return CassetteData.from_dict(data)
 
+    @staticmethod
+    def _load_jsonl(content: bytes) -> CassetteData:
+        """Parse a JSON Lines cassette.
+
+        The first line holds the cassette header (`{"version": 1}`) and every
+        following line holds one interaction, so interactions are built as
+        each line is parsed.
+        """
+        lines = content.splitlines()
+        header = _json_loads(lines[0]) if lines else {}
+        data = CassetteData(version=header.get("version", 1))
+        append = data.interactions.append
+        for line in lines[1:]:
+            if line.strip():
+                append(Interaction.from_dict(_json_loads(line)))
+        return data
+
+    @staticmethod
+    def _load_pb(content: bytes | mmap.mmap) -> CassetteData:
+        """Parse a binary cassette.
+
+        The file is a sequence of frames, each a little-endian uint32 length
+        followed by that many bytes of protobuf. The first frame is the
+        cassette header and every following frame holds one interaction.
+        """
+        frames: list[bytes] = []
+        # Release the view explicitly so a memory-mapped source can be closed.
+        with memoryview(content) as view:
+            offset = 0
+            while offset < len(view):
+                (size,) = _FRAME_PREFIX.unpack_from(view, offset)
+                offset += _FRAME_PREFIX.size
+                if offset + size > len(view):
+                    raise ValueError(f"Truncated frame at byte {offset - _FRAME_PREFIX.size}")
+                frames.append(bytes(view[offset : offset + size]))
+                offset += size
+
+        if not frames:
+            return CassetteData()
+        header = _cassette_pb.Header.FromString(frames[0])
+        version = header.version if header.HasField("version") else 1
+        return CassetteData(
+            version=version,
+            interactions=[Interaction.from_pb(frame) for frame in frames[1:]],
+        )
+
     @staticmethod
     def save(path: Path, data: CassetteData) -> None:
         """Save cassette data to a file.
 
         Creates parent directories if they don't exist. The format is
-        determined by file extension: `.json` for JSON, anything else
-        for YAML.
+        determined by file extension: `.json` for JSON, `.jsonl` for
+        JSON Lines, `.pb` for binary protobuf, anything else for YAML.
+        If the file already holds exactly the serialized content, it is
+        left untouched.
 
         Args:
             path: Path to save the cassette file.
@@ -451,18 +1054,132 @@ class CassetteSerializer:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        dict_data = data.to_dict()
+        try:
+            content: bytes
+            if path.suffix == ".pb":
+                content = CassetteSerializer._dump_pb(data)
+            elif path.suffix == ".jsonl":
+                content = CassetteSerializer._dump_jsonl(data)
+            elif path.suffix == ".json":
+                # Interactions are converted one at a time as the encoder reaches
+                # them, so the full dict tree never exists alongside the output.
+                content = _json_dumps(
+                    {"version": data.version, "interactions": data.interactions},
+                    indent=True,
+                    default=Interaction.to_dict,
+                )
+            elif not path.exists():
+                # Nothing on disk to compare against, so emit straight into the file
+                # instead of holding the whole document in memory first.
+                try:
+                    with path.open("wb") as f:
+                        CassetteSerializer._dump_yaml(data, f)
+                except BaseException:
+                    # Never leave a truncated cassette behind for the next load.
+                    path.unlink(missing_ok=True)
+                    raise
+                return
+            else:
+                buffer = io.BytesIO()
+                CassetteSerializer._dump_yaml(data, buffer)
+                content = buffer.getvalue()
+            if not CassetteSerializer._matches_file(path, content):
+                path.write_bytes(content)
+        except Exception as e:
+            raise SerializationError(f"Failed to write {path}", e) from e
 
+    @staticmethod
+    def _matches_file(path: Path, payload: bytes) -> bool:
+        """Whether the file at `path` already contains exactly `payload`.
+
+        The size is checked first, so a changed cassette usually costs a
+        single stat call; the file is only read when the sizes agree.
+        """
         try:
-            if path.suffix == ".json":
-                content = json.dumps(dict_data, indent=2)
+            if path.stat().st_size != len(payload):
+                return False
+        except FileNotFoundError:
+            return False
+        return path.read_bytes() == payload
+
+    @staticmethod
+    def can_append(path: Path) -> bool:
+        """Whether interactions can be appended to an existing cassette file.
+
+        Only the line- and frame-based formats (`.jsonl`, `.pb`) support
+        appending; other formats must be rewritten in full.
+
+        Args:
+            path: Path to the cassette file.
+
+        Returns:
+            True if `append` supports this file's format.
+        """
+        return path.suffix in (".jsonl", ".pb")
+
+    @staticmethod
+    def append(path: Path, interactions: list[Interaction]) -> None:
+        """Append interactions to an existing `.jsonl` or `.pb` cassette file.
+
+        Args:
+            path: Path to a cassette file previously written by `save`.
+            interactions: The interactions to add after the existing ones.
+
+        Raises:
+            SerializationError: If the file cannot be written.
+        """
+        try:
+            if path.suffix == ".pb":
+                with path.open("ab") as f:
+                    f.write(CassetteSerializer._pb_frames(interactions))
             else:
-                content = yaml.dump(
-                    dict_data,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
-            path.write_text(content, encoding="utf-8")
+                with path.open("a+b") as f:
+                    if f.tell():
+                        # Guard against a hand-edited file missing its final newline.
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            f.write(b"\n")
+                    f.write(CassetteSerializer._jsonl_lines(interactions))
         except Exception as e:
             raise SerializationError(f"Failed to write {path}", e) from e
+
+    @staticmethod
+    def _dump_yaml(data: CassetteData, stream: IO[bytes]) -> None:
+        """Render a YAML cassette as UTF-8 into a binary stream."""
+        yaml.dump(
+            data.to_dict(),
+            stream,
+            Dumper=_YamlDumper,
+            encoding="utf-8",
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+
+    @staticmethod
+    def _dump_jsonl(data: CassetteData) -> bytes:
+        """Render a JSON Lines cassette: a header line, then one line per interaction."""
+        header = _json_dumps({"version": data.version})
+        return header + b"\n" + CassetteSerializer._jsonl_lines(data.interactions)
+
+    @staticmethod
+    def _jsonl_lines(interactions: list[Interaction]) -> bytes:
+        """Render interactions as newline-terminated JSON lines."""
+        return b"".join(_json_dumps(i.to_dict()) + b"\n" for i in interactions)
+
+    @staticmethod
+    def _dump_pb(data: CassetteData) -> bytes:
+        """Render a binary cassette: a header frame, then one frame per interaction."""
+        header = _cassette_pb.Header(version=data.version).SerializeToString()
+        return _FRAME_PREFIX.pack(len(header)) + header + CassetteSerializer._pb_frames(data.interactions)
+
+    @staticmethod
+    def _pb_frames(interactions: list[Interaction]) -> bytes:
+        """Render interactions as length-prefixed protobuf frames."""
+        pack = _FRAME_PREFIX.pack
+        parts: list[bytes] = []
+        for interaction in interactions:
+            payload = interaction.to_pb()
+            parts.append(pack(len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import threading
+import functools
+import itertools
+import os
 from collections.abc import Generator, Iterator
 from concurrent import futures
 from pathlib import Path
@@ -14,9 +16,13 @@ import pytest
 if TYPE_CHECKING:
     from tests.generated import test_service_pb2
 
+_PREBUILT_USERS = 16
+"""Number of `ListUsers` results built once up front and reused for every call."""
 
+
+@functools.cache
 def _import_generated() -> tuple:
-    """Import generated proto modules."""
+    """Import generated proto modules, resolving them once per session."""
     from tests.generated import test_service_pb2, test_service_pb2_grpc
 
     return test_service_pb2, test_service_pb2_grpc
@@ -26,21 +32,28 @@ class TestServiceServicer:
     """Test service implementation for integration tests."""
 
     def __init__(self) -> None:
-        self.pb2, _ = _import_generated()
+        pb2, _ = _import_generated()
+        self._User = pb2.User
+        self._GetUserResponse = pb2.GetUserResponse
+        self._CreateUsersResponse = pb2.CreateUsersResponse
+        self._ChatMessage = pb2.ChatMessage
+        self._users = tuple(self._make_user(i + 1) for i in range(_PREBUILT_USERS))
         self.call_count = 0
 
+    def _make_user(self, user_id: int) -> test_service_pb2.User:
+        return self._User(
+            id=user_id,
+            name=f"User {user_id}",
+            email=f"user{user_id}@example.com",
+        )
+
     def GetUser(
         self,
         request: test_service_pb2.GetUserRequest,
         context: grpc.ServicerContext,
     ) -> test_service_pb2.GetUserResponse:
         self.call_count += 1
-        user = self.pb2.User(
-            id=request.id,
-            name=f"User {request.id}",
-            email=f"user{request.id}@example.com",
-        )
-        return self.pb2.GetUserResponse(user=user)
+        return self._GetUserResponse(user=self._make_user(request.id))
 
     def ListUsers(
         self,
@@ -48,12 +61,10 @@ class TestServiceServicer:
         context: grpc.ServicerContext,
     ) -> Iterator[test_service_pb2.User]:
         self.call_count += 1
-        for i in range(request.limit):
-            yield self.pb2.User(
-                id=i + 1,
-                name=f"User {i + 1}",
-                email=f"user{i + 1}@example.com",
-            )
+        # The prebuilt users are only ever serialized, never mutated, so sharing them is safe.
+        yield from itertools.islice(self._users, request.limit)
+        for i in range(len(self._users), request.limit):
+            yield self._make_user(i + 1)
 
     def CreateUsers(
         self,
@@ -64,7 +75,7 @@ class TestServiceServicer:
         ids = []
         for i, _req in enumerate(request_iterator):
             ids.append(i + 1)
-        return self.pb2.CreateUsersResponse(created_count=len(ids), ids=ids)
+        return self._CreateUsersResponse(created_count=len(ids), ids=ids)
 
     def Chat(
         self,
@@ -72,8 +83,9 @@ class TestServiceServicer:
         context: grpc.ServicerContext,
     ) -> Iterator[test_service_pb2.ChatMessage]:
         self.call_count += 1
+        message_type = self._ChatMessage
         for msg in request_iterator:
-            yield self.pb2.ChatMessage(
+            yield message_type(
                 sender="server",
                 content=f"Echo: {msg.content}",
                 timestamp=msg.timestamp,
@@ -87,27 +99,27 @@ class GrpcTestServer:
         self.server: grpc.Server | None = None
         self.servicer: TestServiceServicer | None = None
         self.port: int | None = None
-        self._started = threading.Event()
 
     def start(self) -> str:
         """Start the test server and return the target address."""
         _, pb2_grpc = _import_generated()
 
         self.servicer = TestServiceServicer()
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1)),
+            options=[("grpc.so_reuseport", 0)],
+        )
         pb2_grpc.add_TestServiceServicer_to_server(self.servicer, self.server)
 
         self.port = self.server.add_insecure_port("[::]:0")
         self.server.start()
-        self._started.set()
 
         return f"localhost:{self.port}"
 
     def stop(self) -> None:
         """Stop the test server."""
         if self.server:
-            self.server.stop(grace=0)
-            self.server.wait_for_termination(timeout=5)
+            self.server.stop(grace=None).wait(timeout=1)
             self.server = None
 
     @property
@@ -136,6 +148,12 @@ def grpc_target(grpc_test_server: GrpcTestServer) -> str:
     return f"localhost:{grpc_test_server.port}"
 
 
+@pytest.fixture
+def offline_target() -> str:
+    """Address nothing listens on, for playback that must never reach the server."""
+    return "localhost:1"
+
+
 @pytest.fixture
 def grpc_servicer(grpc_test_server: GrpcTestServer) -> TestServiceServicer:
     """Get the test servicer instance."""
@@ -144,20 +162,54 @@ def grpc_servicer(grpc_test_server: GrpcTestServer) -> TestServiceServicer:
     return grpc_test_server.servicer
 
 
+@pytest.fixture(scope="session")
+def recorded_cassette_path(
+    tmp_path_factory: pytest.TempPathFactory,
+    grpc_test_server: GrpcTestServer,
+    pb2,
+    pb2_grpc,
+) -> Path:
+    """Cassette with one recorded call per RPC type, shared by the playback tests."""
+    from grpcvcr import Cassette, RecordingChannel, RecordMode
+
+    path = tmp_path_factory.mktemp("recorded") / "cassette.yaml"
+    cassette = Cassette(path, record_mode=RecordMode.ALL)
+    with RecordingChannel(cassette, f"localhost:{grpc_test_server.port}") as recording:
+        stub = pb2_grpc.TestServiceStub(recording.channel)
+        stub.GetUser(pb2.GetUserRequest(id=42))
+        list(stub.ListUsers(pb2.ListUsersRequest(limit=3)))
+        stub.CreateUsers(
+            pb2.CreateUserRequest(name=name, email=f"{name.lower()}@example.com")
+            for name in ["Alice", "Bob", "Charlie"]
+        )
+        chat = [
+            pb2.ChatMessage(sender="client", content="Hello", timestamp=1000),
+            pb2.ChatMessage(sender="client", content="World", timestamp=2000),
+        ]
+        list(stub.Chat(iter(chat)))
+    return path
+
+
+@pytest.fixture(scope="session")
+def ssl_credentials() -> grpc.ChannelCredentials:
+    """Default SSL channel credentials, loaded once per session."""
+    return grpc.ssl_channel_credentials()
+
+
 @pytest.fixture
 def tmp_cassette_path(tmp_path: Path) -> Path:
     """Temporary path for a cassette file."""
     return tmp_path / "test_cassette.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pb2():
     """Get the test_service_pb2 module."""
     pb2, _ = _import_generated()
     return pb2
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pb2_grpc():
     """Get the test_service_pb2_grpc module."""
     _, pb2_grpc = _import_generated()
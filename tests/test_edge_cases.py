@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import importlib
 import sys
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from types import ModuleType
 from unittest.mock import patch
 
 import grpc
 import pytest
+from google.protobuf import wrappers_pb2
 from grpc import aio
 
 from grpcvcr import (
@@ -17,13 +19,22 @@ from grpcvcr import (
     MetadataMatcher,
     MethodMatcher,
     RecordMode,
+    RequestMatcher,
     use_cassette,
 )
 from grpcvcr.channel import AsyncRecordingChannel, RecordingChannel
-from grpcvcr.errors import SerializationError
+from grpcvcr.errors import NoMatchingInteractionError, RecordingDisabledError, SerializationError
 from grpcvcr.interceptors._base import _FakeStreamingCall, _FakeUnaryCall
-from grpcvcr.interceptors.aio import _AsyncFakeStreamingCall, _AsyncFakeUnaryCall
+from grpcvcr.interceptors.aio import (
+    _AsyncFakeStreamingCall,
+    _AsyncFakeUnaryCall,
+    _replay_streaming,
+    _replay_unary,
+    create_async_interceptors,
+)
+from grpcvcr.interceptors.sync import _record_streaming, _record_unary, create_interceptors
 from grpcvcr.serialization import (
+    _CLASS_CACHE,
     CassetteData,
     CassetteSerializer,
     Interaction,
@@ -31,6 +42,8 @@ from grpcvcr.serialization import (
     InteractionResponse,
     StreamingInteractionResponse,
     _get_importable_module_path,
+    _iter_serialized,
+    _load_class,
 )
 
 
@@ -46,6 +59,24 @@ class TestCassetteEdgeCases:
         assert len(cassette.interactions) == 0
         assert cassette.can_record
 
+    def test_record_mode_all_starts_fresh(self, tmp_path: Path) -> None:
+        cassette_path = tmp_path / "all_test.yaml"
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/Method", b""),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        CassetteSerializer.save(cassette_path, CassetteData(interactions=[interaction]))
+
+        with (
+            patch.object(CassetteSerializer, "load") as load,
+            Cassette(cassette_path, record_mode=RecordMode.ALL) as cassette,
+        ):
+            assert cassette.interactions == []
+        load.assert_not_called()
+
+        assert CassetteSerializer.load(cassette_path).interactions == []
+
     def test_cassette_context_manager(self, tmp_path: Path) -> None:
         cassette_path = tmp_path / "context_test.yaml"
         with Cassette(cassette_path, record_mode=RecordMode.ALL) as cassette:
@@ -58,6 +89,257 @@ class TestCassetteEdgeCases:
 
         assert cassette_path.exists()
 
+    def test_find_interaction_uses_index(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "index.yaml", match_on=MethodMatcher() & RequestMatcher())
+        for method, body in [("/test/A", b"1"), ("/test/A", b"2"), ("/test/B", b"1")]:
+            cassette.record_interaction(
+                Interaction(
+                    request=InteractionRequest.from_grpc(method, body),
+                    response=InteractionResponse.from_grpc(body, "OK"),
+                    rpc_type="unary",
+                )
+            )
+
+        found = cassette.find_interaction(InteractionRequest.from_grpc("/test/A", b"2"))
+        assert found is cassette.interactions[1]
+        assert cassette.find_interaction(InteractionRequest.from_grpc("/test/B", b"2")) is None
+
+    def test_find_interaction_reindexes_after_changes(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "index.yaml")
+        first = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b""),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        second = Interaction(
+            request=InteractionRequest.from_grpc("/test/B", b""),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(first)
+        cassette.record_interaction(second)
+        assert cassette.find_interaction(second.request) is second
+
+        cassette.interactions.remove(first)
+        assert cassette.find_interaction(first.request) is None
+        assert cassette.find_interaction(second.request) is second
+
+        cassette.match_on = RequestMatcher()
+        assert cassette.find_interaction(InteractionRequest.from_grpc("/test/C", b"")) is second
+
+    def test_find_interaction_without_index_key(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "index.yaml", match_on=MetadataMatcher())
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"", (("key", "value"),)),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(interaction)
+
+        found = cassette.find_interaction(InteractionRequest.from_grpc("/test/B", b"", (("key", "value"),)))
+        assert found is interaction
+
+    def test_record_all_replaces_in_place(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "all.yaml", record_mode=RecordMode.ALL)
+        for method in ["/test/A", "/test/B", "/test/A"]:
+            cassette.record_interaction(
+                Interaction(
+                    request=InteractionRequest.from_grpc(method, b""),
+                    response=InteractionResponse.from_grpc(b"", "OK"),
+                    rpc_type="unary",
+                )
+            )
+
+        assert [i.method for i in cassette.interactions] == ["/test/A", "/test/B"]
+        assert cassette.find_interaction(InteractionRequest.from_grpc("/test/A", b"")) is cassette.interactions[0]
+
+    def test_record_all_removes_duplicate_matches(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "all.yaml", match_on=MetadataMatcher())
+        for method in ["/test/A", "/test/B", "/test/C"]:
+            cassette.record_interaction(
+                Interaction(
+                    request=InteractionRequest.from_grpc(method, b""),
+                    response=InteractionResponse.from_grpc(b"", "OK"),
+                    rpc_type="unary",
+                )
+            )
+
+        cassette.record_mode = RecordMode.ALL
+        replacement = Interaction(
+            request=InteractionRequest.from_grpc("/test/D", b""),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(replacement)
+
+        assert cassette.interactions == [replacement]
+
+    def test_get_response_memoizes_lookups(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "memo.yaml")
+        first = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"1"),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(first)
+
+        assert cassette.get_response("/test/A", b"1") is first
+        with patch.object(Cassette, "find_interaction") as find:
+            assert cassette.get_response("/test/A", b"1") is first
+        find.assert_not_called()
+
+        cassette.record_mode = RecordMode.ALL
+        second = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"2"),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(second)
+        assert cassette.get_response("/test/A", b"1") is second
+
+        cassette.match_on = RequestMatcher()
+        with pytest.raises(NoMatchingInteractionError):
+            cassette.get_response("/test/A", b"1")
+
+    def test_find_recorded_returns_none_on_miss(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "memo.yaml", match_on=MethodMatcher() & RequestMatcher())
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"1"),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(interaction)
+
+        assert cassette.find_recorded("/test/A", b"2") is None
+        assert cassette._responses == {}
+        assert cassette.find_recorded("/test/A", b"1", (("key", "value"),)) is interaction
+        assert list(cassette._responses) == [("/test/A", b"1", (("key", "value"),))]
+
+    def test_find_recorded_method_matcher_skips_request_conversion(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "memo.yaml")
+        first, second = (
+            Interaction(
+                request=InteractionRequest.from_grpc("/test/A", body),
+                response=InteractionResponse.from_grpc(b"", "OK"),
+                rpc_type="unary",
+            )
+            for body in (b"1", b"2")
+        )
+        cassette.record_interaction(first)
+        cassette.record_interaction(second)
+
+        with patch.object(InteractionRequest, "from_grpc") as from_grpc:
+            assert cassette.find_recorded("/test/A", b"3") is first
+            assert cassette.find_recorded("/test/B", b"1") is None
+        from_grpc.assert_not_called()
+
+    def test_get_response_with_unhashable_metadata(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "memo.yaml")
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b""),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(interaction)
+
+        metadata = [("key", "value")]
+        assert cassette.get_response("/test/A", b"", metadata) is interaction  # type: ignore[arg-type]
+        assert cassette._responses == {}
+
+    def test_get_response_with_memoryview_body(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "memo.yaml", match_on=MethodMatcher() & RequestMatcher())
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"body"),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        cassette.record_interaction(interaction)
+
+        buffer = b"xxbodyxx"
+        assert cassette.get_response("/test/A", memoryview(buffer)[2:6]) is interaction
+        assert cassette._responses == {}
+
+        with pytest.raises(NoMatchingInteractionError) as exc_info:
+            cassette.get_response("/test/A", memoryview(buffer)[:2])
+        assert exc_info.value.request == b"xx"
+
+        message = str(exc_info.value)
+        cassette.record_interaction(
+            Interaction(
+                request=InteractionRequest.from_grpc("/test/B", b""),
+                response=InteractionResponse.from_grpc(b"", "OK"),
+                rpc_type="unary",
+            )
+        )
+        assert exc_info.value.available == [interaction]
+        assert str(exc_info.value) == message
+
+    def test_get_response_recording_disabled(self, tmp_path: Path) -> None:
+        cassette_path = tmp_path / "memo.yaml"
+        CassetteSerializer.save(cassette_path, CassetteData())
+        cassette = Cassette(cassette_path, record_mode=RecordMode.NONE)
+
+        with pytest.raises(RecordingDisabledError):
+            cassette.get_response("/test/A", b"")
+
+    def test_save_appends_new_interactions(self, tmp_path: Path) -> None:
+        cassette_path = tmp_path / "append.jsonl"
+        with Cassette(cassette_path) as cassette:
+            cassette.record_interaction(
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/A", b""),
+                    response=InteractionResponse.from_grpc(b"", "OK"),
+                    rpc_type="unary",
+                )
+            )
+
+        cassette = Cassette(cassette_path)
+        cassette.record_interaction(
+            Interaction(
+                request=InteractionRequest.from_grpc("/test/B", b""),
+                response=InteractionResponse.from_grpc(b"", "OK"),
+                rpc_type="unary",
+            )
+        )
+        with patch.object(CassetteSerializer, "save") as save:
+            cassette.save()
+        save.assert_not_called()
+
+        assert [i.method for i in CassetteSerializer.load(cassette_path).interactions] == ["/test/A", "/test/B"]
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".pb"])
+    def test_save_into_empty_file_writes_header(self, tmp_path: Path, suffix: str) -> None:
+        cassette_path = tmp_path / f"empty{suffix}"
+        cassette_path.write_bytes(b"")
+        with Cassette(cassette_path) as cassette:
+            cassette.record_interaction(
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/A", b""),
+                    response=InteractionResponse.from_grpc(b"", "OK"),
+                    rpc_type="unary",
+                )
+            )
+
+        assert [i.method for i in CassetteSerializer.load(cassette_path).interactions] == ["/test/A"]
+
+    def test_save_rewrites_after_replacement(self, tmp_path: Path) -> None:
+        cassette_path = tmp_path / "append.pb"
+        with Cassette(cassette_path, record_mode=RecordMode.ALL) as cassette:
+            for body in [b"old", b"new"]:
+                cassette.record_interaction(
+                    Interaction(
+                        request=InteractionRequest.from_grpc("/test/A", b""),
+                        response=InteractionResponse.from_grpc(body, "OK"),
+                        rpc_type="unary",
+                    )
+                )
+                cassette.save()
+
+        loaded = CassetteSerializer.load(cassette_path).interactions
+        assert len(loaded) == 1
+        assert isinstance(loaded[0].response, InteractionResponse)
+        assert loaded[0].response.get_body_bytes() == b"new"
+
     def test_use_cassette_function(self, tmp_path: Path, grpc_target: str, pb2, pb2_grpc, grpc_servicer) -> None:
         cassette_path = tmp_path / "use_cassette_test.yaml"
 
@@ -73,34 +355,155 @@ class TestCassetteEdgeCases:
 
 
 class TestChannelEdgeCases:
-    def test_recording_channel_with_credentials(self, tmp_path: Path) -> None:
+    def test_recording_channel_with_credentials(self, tmp_path: Path, ssl_credentials: grpc.ChannelCredentials) -> None:
         cassette_path = tmp_path / "secure_test.yaml"
         cassette = Cassette(cassette_path, record_mode=RecordMode.ALL)
-        credentials = grpc.ssl_channel_credentials()
 
         recording = RecordingChannel(
             cassette,
             "localhost:50051",
-            credentials=credentials,
+            credentials=ssl_credentials,
             options=[("grpc.ssl_target_name_override", "localhost")],
         )
         recording.close()
 
-    def test_async_recording_channel_with_credentials(self, tmp_path: Path) -> None:
+    def test_async_recording_channel_with_credentials(
+        self, tmp_path: Path, ssl_credentials: grpc.ChannelCredentials
+    ) -> None:
         cassette_path = tmp_path / "async_secure_test.yaml"
         cassette = Cassette(cassette_path, record_mode=RecordMode.ALL)
-        credentials = grpc.ssl_channel_credentials()
 
         AsyncRecordingChannel(
             cassette,
             "localhost:50051",
-            credentials=credentials,
+            credentials=ssl_credentials,
             options=[("grpc.ssl_target_name_override", "localhost")],
         )
         cassette.save()
 
+    def test_interceptors_shared_per_cassette(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "shared.yaml")
+        other = Cassette(tmp_path / "other.yaml")
+
+        for factory in (create_interceptors, create_async_interceptors):
+            first = factory(cassette)
+            second = factory(cassette)
+            assert first == second
+            assert first is not second
+            assert all(interceptor.cassette is cassette for interceptor in first)
+            assert factory(other) != first
+
+
+class _NotFoundError(grpc.RpcError):
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.NOT_FOUND
+
+    def details(self) -> str:
+        return "missing"
+
+
+class _FailingResponse:
+    def result(self) -> None:
+        raise _NotFoundError()
+
+    def __iter__(self) -> _FailingResponse:
+        return self
+
+    def __next__(self) -> None:
+        raise _NotFoundError()
+
+    def trailing_metadata(self) -> None:
+        raise RuntimeError("call was never started")
+
+
+class TestSyncRecordingEdgeCases:
+    def test_record_unary_error(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "errors.yaml", record_mode=RecordMode.ALL)
+        req = InteractionRequest.from_grpc("/test/A", b"")
+
+        _record_unary(cassette, req, _FailingResponse(), "unary")
+
+        [interaction] = cassette.interactions
+        assert isinstance(interaction.response, InteractionResponse)
+        assert interaction.response.code == "NOT_FOUND"
+        assert interaction.response.details == "missing"
+        assert interaction.response.get_body_bytes() == b""
+        assert interaction.response.trailing_metadata == {}
+
+    def test_record_streaming_error(self, tmp_path: Path) -> None:
+        cassette = Cassette(tmp_path / "errors.yaml", record_mode=RecordMode.ALL)
+        req = InteractionRequest.from_grpc("/test/A", b"")
+
+        call = _record_streaming(cassette, req, _FailingResponse(), "server_streaming")
+
+        [interaction] = cassette.interactions
+        assert isinstance(interaction.response, StreamingInteractionResponse)
+        assert interaction.response.code == "NOT_FOUND"
+        assert interaction.response.messages == []
+        assert call.code() == grpc.StatusCode.NOT_FOUND
+        assert call.details() == "missing"
+
+
+@pytest.fixture(scope="module")
+def ok_unary_call() -> _FakeUnaryCall:
+    return _FakeUnaryCall(result="test", code=grpc.StatusCode.OK, details=None, trailing_metadata=())
+
+
+@pytest.fixture(scope="module")
+def ok_streaming_call() -> _FakeStreamingCall:
+    return _FakeStreamingCall(messages=[], code=grpc.StatusCode.OK, details=None, trailing_metadata=())
+
+
+@pytest.fixture(scope="module")
+def ok_async_unary_call() -> _AsyncFakeUnaryCall:
+    return _AsyncFakeUnaryCall(result="test", code=grpc.StatusCode.OK, details=None, trailing_metadata=())
+
+
+@pytest.fixture(scope="module")
+def ok_async_streaming_call() -> _AsyncFakeStreamingCall:
+    return _AsyncFakeStreamingCall(messages=[], code=grpc.StatusCode.OK, details=None, trailing_metadata=())
+
+
+@pytest.fixture(scope="module")
+def invalid_json_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("bad") / "invalid.json"
+    path.write_text("{ invalid json }", encoding="utf-8")
+    return path
+
 
 class TestFakeCallEdgeCases:
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            ("code", grpc.StatusCode.OK),
+            ("cancelled", False),
+            ("running", False),
+            ("done", True),
+            ("exception", None),
+            ("traceback", None),
+            ("is_active", False),
+            ("time_remaining", None),
+            ("cancel", False),
+        ],
+    )
+    def test_fake_unary_call_state(self, ok_unary_call: _FakeUnaryCall, method: str, expected: object) -> None:
+        assert getattr(ok_unary_call, method)() is expected
+
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            ("code", grpc.StatusCode.OK),
+            ("cancelled", False),
+            ("is_active", False),
+            ("time_remaining", None),
+            ("cancel", False),
+        ],
+    )
+    def test_fake_streaming_call_state(
+        self, ok_streaming_call: _FakeStreamingCall, method: str, expected: object
+    ) -> None:
+        assert getattr(ok_streaming_call, method)() is expected
+
     def test_fake_unary_call_result_raises_on_error(self) -> None:
         call = _FakeUnaryCall(
             result=None,
@@ -111,15 +514,6 @@ class TestFakeCallEdgeCases:
         with pytest.raises(grpc.RpcError):
             call.result()
 
-    def test_fake_unary_call_code(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.code() == grpc.StatusCode.OK
-
     def test_fake_unary_call_details(self) -> None:
         call = _FakeUnaryCall(
             result=None,
@@ -129,44 +523,11 @@ class TestFakeCallEdgeCases:
         )
         assert call.details() == "Not found"
 
-    def test_fake_unary_call_cancelled(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancelled() is False
-
-    def test_fake_unary_call_running(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.running() is False
-
-    def test_fake_unary_call_done(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.done() is True
-
-    def test_fake_unary_call_add_done_callback(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
+    def test_fake_unary_call_add_done_callback(self, ok_unary_call: _FakeUnaryCall) -> None:
         called = []
-        call.add_done_callback(lambda c: called.append(c))
+        ok_unary_call.add_done_callback(lambda c: called.append(c))
         assert len(called) == 1
-        assert called[0] is call
+        assert called[0] is ok_unary_call
 
     def test_fake_unary_call_exception_returns_error_on_failure(self) -> None:
         call = _FakeUnaryCall(
@@ -178,72 +539,12 @@ class TestFakeCallEdgeCases:
         exc = call.exception()
         assert isinstance(exc, grpc.RpcError)
 
-    def test_fake_unary_call_exception_returns_none_on_success(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.exception() is None
-
-    def test_fake_unary_call_traceback(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.traceback() is None
-
-    def test_fake_unary_call_add_callback(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
+    def test_fake_unary_call_add_callback(self, ok_unary_call: _FakeUnaryCall) -> None:
         called = []
-        result = call.add_callback(lambda c: called.append(c))
+        result = ok_unary_call.add_callback(lambda c: called.append(c))
         assert result is True
         assert len(called) == 1
 
-    def test_fake_unary_call_is_active(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.is_active() is False
-
-    def test_fake_unary_call_time_remaining(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.time_remaining() is None
-
-    def test_fake_unary_call_cancel(self) -> None:
-        call = _FakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancel() is False
-
-    def test_fake_streaming_call_code(self) -> None:
-        call = _FakeStreamingCall(
-            messages=["msg1", "msg2"],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.code() == grpc.StatusCode.OK
-
     def test_fake_streaming_call_details(self) -> None:
         call = _FakeStreamingCall(
             messages=[],
@@ -253,130 +554,32 @@ class TestFakeCallEdgeCases:
         )
         assert call.details() == "Error"
 
-    def test_fake_streaming_call_cancelled(self) -> None:
-        call = _FakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancelled() is False
-
-    def test_fake_streaming_call_add_callback(self) -> None:
-        call = _FakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
+    def test_fake_streaming_call_add_callback(self, ok_streaming_call: _FakeStreamingCall) -> None:
         called = []
-        result = call.add_callback(lambda c: called.append(c))
+        result = ok_streaming_call.add_callback(lambda c: called.append(c))
         assert result is True
         assert len(called) == 1
 
-    def test_fake_streaming_call_is_active(self) -> None:
-        call = _FakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.is_active() is False
-
-    def test_fake_streaming_call_time_remaining(self) -> None:
-        call = _FakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.time_remaining() is None
-
-    def test_fake_streaming_call_cancel(self) -> None:
-        call = _FakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancel() is False
-
 
 class TestAsyncFakeCallSyncMethods:
-    def test_async_fake_unary_call_cancelled(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancelled() is False
-
-    def test_async_fake_unary_call_done(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.done() is True
-
-    def test_async_fake_unary_call_cancel(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancel() is False
-
-    def test_async_fake_unary_call_time_remaining(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.time_remaining() is None
-
-    def test_async_fake_streaming_call_cancelled(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancelled() is False
-
-    def test_async_fake_streaming_call_done(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.done() is True
-
-    def test_async_fake_streaming_call_cancel(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.cancel() is False
-
-    def test_async_fake_streaming_call_time_remaining(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert call.time_remaining() is None
-
-
-@pytest.mark.asyncio
+    @pytest.mark.parametrize("fixture", ["ok_async_unary_call", "ok_async_streaming_call"])
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            ("cancelled", False),
+            ("done", True),
+            ("cancel", False),
+            ("time_remaining", None),
+        ],
+    )
+    def test_async_fake_call_state(
+        self, request: pytest.FixtureRequest, fixture: str, method: str, expected: object
+    ) -> None:
+        call = request.getfixturevalue(fixture)
+        assert getattr(call, method)() is expected
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncFakeCallAsyncMethods:
     async def test_async_fake_unary_call_await_raises_on_error(self) -> None:
         call = _AsyncFakeUnaryCall(
@@ -388,14 +591,8 @@ class TestAsyncFakeCallAsyncMethods:
         with pytest.raises(aio.AioRpcError):
             await call
 
-    async def test_async_fake_unary_call_code(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert await call.code() == grpc.StatusCode.OK
+    async def test_async_fake_unary_call_code(self, ok_async_unary_call: _AsyncFakeUnaryCall) -> None:
+        assert await ok_async_unary_call.code() == grpc.StatusCode.OK
 
     async def test_async_fake_unary_call_details(self) -> None:
         call = _AsyncFakeUnaryCall(
@@ -406,14 +603,8 @@ class TestAsyncFakeCallAsyncMethods:
         )
         assert await call.details() == "Not found"
 
-    async def test_async_fake_unary_call_wait_for_connection(self) -> None:
-        call = _AsyncFakeUnaryCall(
-            result="test",
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        await call.wait_for_connection()
+    async def test_async_fake_unary_call_wait_for_connection(self, ok_async_unary_call: _AsyncFakeUnaryCall) -> None:
+        await ok_async_unary_call.wait_for_connection()
 
     async def test_async_fake_streaming_call_iterate_raises_on_error(self) -> None:
         call = _AsyncFakeStreamingCall(
@@ -429,14 +620,8 @@ class TestAsyncFakeCallAsyncMethods:
 
         assert messages == ["msg1", "msg2"]
 
-    async def test_async_fake_streaming_call_code(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=["msg"],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
-        )
-        assert await call.code() == grpc.StatusCode.OK
+    async def test_async_fake_streaming_call_code(self, ok_async_streaming_call: _AsyncFakeStreamingCall) -> None:
+        assert await ok_async_streaming_call.code() == grpc.StatusCode.OK
 
     async def test_async_fake_streaming_call_details(self) -> None:
         call = _AsyncFakeStreamingCall(
@@ -447,14 +632,33 @@ class TestAsyncFakeCallAsyncMethods:
         )
         assert await call.details() == "Error"
 
-    async def test_async_fake_streaming_call_wait_for_connection(self) -> None:
-        call = _AsyncFakeStreamingCall(
-            messages=[],
-            code=grpc.StatusCode.OK,
-            details=None,
-            trailing_metadata=(),
+    async def test_async_fake_streaming_call_wait_for_connection(
+        self, ok_async_streaming_call: _AsyncFakeStreamingCall
+    ) -> None:
+        await ok_async_streaming_call.wait_for_connection()
+
+    async def test_replay_without_response_type_uses_request_type(self) -> None:
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/Method", b""),
+            response=InteractionResponse.from_grpc(b"body", "OK"),
+            rpc_type="unary",
         )
-        await call.wait_for_connection()
+
+        class RequestType:
+            @staticmethod
+            def FromString(data: bytes) -> str:
+                return data.decode()
+
+        assert await _replay_unary(interaction, RequestType) == "body"
+
+    async def test_replay_without_any_type_returns_raw_bytes(self) -> None:
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/Stream", b""),
+            response=StreamingInteractionResponse.from_grpc([b"m1", b"m2"], "OK"),
+            rpc_type="bidi_streaming",
+        )
+
+        assert [msg async for msg in _replay_streaming(interaction, None)] == [b"m1", b"m2"]
 
 
 class TestMatcherEdgeCases:
@@ -489,6 +693,17 @@ class TestMatcherEdgeCases:
 
 
 class TestSerializationEdgeCases:
+    def test_iter_serialized_with_mixed_types(self) -> None:
+        messages = [
+            wrappers_pb2.StringValue(value="a"),
+            wrappers_pb2.StringValue(value="b"),
+            wrappers_pb2.Int32Value(value=7),
+            wrappers_pb2.StringValue(value="c"),
+        ]
+        assert list(_iter_serialized(messages)) == [m.SerializeToString() for m in messages]
+        assert list(_iter_serialized(iter(messages))) == [m.SerializeToString() for m in messages]
+        assert list(_iter_serialized([])) == []
+
     def test_get_importable_module_path_fallback(self) -> None:
         class UnregisteredClass:
             pass
@@ -539,6 +754,71 @@ class TestSerializationEdgeCases:
             else:
                 sys.modules["_test_bad_module_"] = original_value
 
+    def test_get_importable_module_path_caches_result(self) -> None:
+        module = ModuleType("_test_cached_module_")
+
+        class CachedClass:
+            pass
+
+        module.CachedClass = CachedClass  # type: ignore[attr-defined]
+        sys.modules["_test_cached_module_"] = module
+        try:
+            assert _get_importable_module_path(CachedClass) == "_test_cached_module_.CachedClass"
+        finally:
+            del sys.modules["_test_cached_module_"]
+
+        assert _get_importable_module_path(CachedClass) == "_test_cached_module_.CachedClass"
+
+    def test_get_importable_module_path_probes_pb2_module(self) -> None:
+        class ProbedClass:
+            pass
+
+        ProbedClass.__module__ = "_test_probed_"
+        module = ModuleType("_test_probed__pb2")
+        module.ProbedClass = ProbedClass  # type: ignore[attr-defined]
+        sys.modules["_test_probed__pb2"] = module
+        try:
+            path = _get_importable_module_path(ProbedClass)
+        finally:
+            del sys.modules["_test_probed__pb2"]
+
+        assert path == "_test_probed__pb2.ProbedClass"
+
+    def test_get_importable_module_path_reported_module_getattr_exception(self) -> None:
+        class BadModule(ModuleType):
+            def __getattr__(self, name: str) -> None:
+                raise RuntimeError("Cannot get attribute")
+
+        class ReportedClass:
+            pass
+
+        ReportedClass.__module__ = "_test_bad_reported_"
+        sys.modules["_test_bad_reported_"] = BadModule("_test_bad_reported_")
+        try:
+            path = _get_importable_module_path(ReportedClass)
+        finally:
+            del sys.modules["_test_bad_reported_"]
+
+        assert path == "_test_bad_reported_.ReportedClass"
+
+    def test_load_class_caches_result(self) -> None:
+        _CLASS_CACHE.pop("pathlib.PurePosixPath", None)
+        with patch("grpcvcr.serialization.importlib.import_module") as mock_import:
+            assert _load_class("pathlib.PurePosixPath") is PurePosixPath
+            assert _load_class("pathlib.PurePosixPath") is PurePosixPath
+
+        mock_import.assert_not_called()
+        assert _CLASS_CACHE["pathlib.PurePosixPath"] is PurePosixPath
+
+    def test_load_class_imports_missing_module(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        monkeypatch.delitem(_CLASS_CACHE, "colorsys.rgb_to_hsv", raising=False)
+        with patch("grpcvcr.serialization.importlib.import_module", wraps=importlib.import_module) as mock_import:
+            loaded = _load_class("colorsys.rgb_to_hsv")
+
+        mock_import.assert_called_once_with("colorsys")
+        assert loaded is sys.modules["colorsys"].rgb_to_hsv
+
     def test_interaction_response_get_response_class_none(self) -> None:
         response = InteractionResponse(
             body="dGVzdA==",
@@ -555,12 +835,9 @@ class TestSerializationEdgeCases:
         )
         assert response.get_response_class() is None
 
-    def test_cassette_serializer_load_json_error(self, tmp_path: Path) -> None:
-        json_path = tmp_path / "invalid.json"
-        json_path.write_text("{ invalid json }", encoding="utf-8")
-
+    def test_cassette_serializer_load_json_error(self, invalid_json_path: Path) -> None:
         with pytest.raises(SerializationError) as exc_info:
-            CassetteSerializer.load(json_path)
+            CassetteSerializer.load(invalid_json_path)
 
         assert "Failed to parse" in str(exc_info.value)
 
@@ -568,8 +845,40 @@ class TestSerializationEdgeCases:
         unwritable_path = tmp_path / "nonexistent" / "deep" / "nested" / "test.json"
         data = CassetteData()
 
-        with patch.object(Path, "write_text", side_effect=PermissionError("Cannot write")):
+        with patch.object(Path, "write_bytes", side_effect=PermissionError("Cannot write")):
             with pytest.raises(SerializationError) as exc_info:
                 CassetteSerializer.save(unwritable_path, data)
 
             assert "Failed to write" in str(exc_info.value)
+
+    def test_cassette_serializer_failed_yaml_save_leaves_no_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.yaml"
+        response = InteractionResponse.from_grpc(b"", "OK")
+        response.details = object()  # type: ignore[assignment]
+        data = CassetteData(
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/A", b""),
+                    response=response,
+                    rpc_type="unary",
+                )
+            ]
+        )
+
+        with pytest.raises(SerializationError, match="Failed to write"):
+            CassetteSerializer.save(path, data)
+
+        assert not path.exists()
+
+    def test_cassette_serializer_load_empty_yaml_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.yaml"
+        path.write_bytes(b"")
+
+        with pytest.raises(SerializationError, match="empty"):
+            CassetteSerializer.load(path)
+
+    def test_cassette_serializer_append_error(self, tmp_path: Path) -> None:
+        missing_path = tmp_path / "missing" / "test.pb"
+
+        with pytest.raises(SerializationError, match="Failed to write"):
+            CassetteSerializer.append(missing_path, [])
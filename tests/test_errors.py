@@ -1,5 +1,7 @@
 """Tests for error classes."""
 
+import pytest
+
 from grpcvcr.errors import (
     CassetteNotFoundError,
     CassetteWriteError,
@@ -10,6 +12,9 @@ from grpcvcr.errors import (
 )
 from grpcvcr.serialization import Interaction, InteractionRequest, InteractionResponse
 
+_DISK_FULL = OSError("disk full")
+_INVALID_DATA = ValueError("invalid data")
+
 
 class TestGrpcvcrError:
     def test_base_exception(self) -> None:
@@ -18,11 +23,30 @@ class TestGrpcvcrError:
         assert isinstance(err, Exception)
 
 
-class TestCassetteNotFoundError:
-    def test_message_contains_path(self) -> None:
-        err = CassetteNotFoundError("/path/to/cassette.yaml")
-        assert "/path/to/cassette.yaml" in str(err)
-        assert err.path == "/path/to/cassette.yaml"
+@pytest.mark.parametrize(
+    ("err", "text", "attributes"),
+    [
+        (
+            CassetteNotFoundError("/path/to/cassette.yaml"),
+            "/path/to/cassette.yaml",
+            {"path": "/path/to/cassette.yaml"},
+        ),
+        (RecordingDisabledError("/test/Method"), "/test/Method", {"method": "/test/Method"}),
+        (
+            CassetteWriteError("/path/to/cassette.yaml", _DISK_FULL),
+            "/path/to/cassette.yaml",
+            {"path": "/path/to/cassette.yaml", "cause": _DISK_FULL},
+        ),
+        (SerializationError("Failed to serialize", _INVALID_DATA), "Failed to serialize", {"cause": _INVALID_DATA}),
+        (SerializationError("Generic error"), "Generic error", {"cause": None}),
+    ],
+    ids=["cassette-not-found", "recording-disabled", "cassette-write", "serialization-with-cause", "serialization"],
+)
+def test_error_message_and_attributes(err: GrpcvcrError, text: str, attributes: dict[str, object]) -> None:
+    assert isinstance(err, GrpcvcrError)
+    assert text in str(err)
+    for name, value in attributes.items():
+        assert getattr(err, name) == value
 
 
 class TestNoMatchingInteractionError:
@@ -39,28 +63,14 @@ class TestNoMatchingInteractionError:
         assert err.method == "/test/TargetMethod"
         assert err.available == interactions
 
-
-class TestRecordingDisabledError:
-    def test_message_contains_method(self) -> None:
-        err = RecordingDisabledError("/test/Method")
-        assert "/test/Method" in str(err)
-        assert err.method == "/test/Method"
-
-
-class TestCassetteWriteError:
-    def test_message_contains_path_and_cause(self) -> None:
-        cause = OSError("disk full")
-        err = CassetteWriteError("/path/to/cassette.yaml", cause)
-        assert "/path/to/cassette.yaml" in str(err)
-        assert err.cause == cause
-
-
-class TestSerializationError:
-    def test_with_cause(self) -> None:
-        cause = ValueError("invalid data")
-        err = SerializationError("Failed to serialize", cause)
-        assert err.cause == cause
-
-    def test_without_cause(self) -> None:
-        err = SerializationError("Generic error")
-        assert err.cause is None
+    def test_message_lists_available_methods(self) -> None:
+        interactions = [
+            Interaction(
+                request=InteractionRequest.from_grpc("/test/Method1", b""),
+                response=InteractionResponse.from_grpc(b"", "OK"),
+                rpc_type="unary",
+            )
+        ]
+        err = NoMatchingInteractionError("/test/TargetMethod", b"request", interactions)
+        assert str(err) == "No matching interaction for /test/TargetMethod. Available: ['/test/Method1']"
+        assert err.args == (str(err),)
@@ -43,23 +43,15 @@ class TestUnaryRecordingPlayback:
 
     def test_playback_unary_call(
         self,
-        grpc_target: str,
-        tmp_cassette_path: Path,
+        offline_target: str,
+        recorded_cassette_path: Path,
         grpc_servicer,
         pb2,
         pb2_grpc,
     ) -> None:
-        """Record then playback a unary RPC call."""
-        cassette = Cassette(tmp_cassette_path, record_mode=RecordMode.ALL)
-        with RecordingChannel(cassette, grpc_target) as recording:
-            stub = pb2_grpc.TestServiceStub(recording.channel)
-            stub.GetUser(pb2.GetUserRequest(id=42))
-
-        assert grpc_servicer.call_count == 1
-
-        grpc_servicer.call_count = 0
-        cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        with RecordingChannel(cassette2, grpc_target) as recording:
+        """Playback a unary RPC call."""
+        cassette = Cassette(recorded_cassette_path, record_mode=RecordMode.NONE)
+        with RecordingChannel(cassette, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             response = stub.GetUser(pb2.GetUserRequest(id=42))
 
@@ -197,22 +189,15 @@ class TestServerStreaming:
 
     def test_playback_server_streaming(
         self,
-        grpc_target: str,
-        tmp_cassette_path: Path,
+        offline_target: str,
+        recorded_cassette_path: Path,
         grpc_servicer,
         pb2,
         pb2_grpc,
     ) -> None:
         """Playback a server streaming RPC call."""
-        cassette = Cassette(tmp_cassette_path, record_mode=RecordMode.ALL)
-        with RecordingChannel(cassette, grpc_target) as recording:
-            stub = pb2_grpc.TestServiceStub(recording.channel)
-            list(stub.ListUsers(pb2.ListUsersRequest(limit=3)))
-
-        grpc_servicer.call_count = 0
-
-        cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        with RecordingChannel(cassette2, grpc_target) as recording:
+        cassette = Cassette(recorded_cassette_path, record_mode=RecordMode.NONE)
+        with RecordingChannel(cassette, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             responses = list(stub.ListUsers(pb2.ListUsersRequest(limit=3)))
 
@@ -249,27 +234,20 @@ class TestClientStreaming:
 
     def test_playback_client_streaming(
         self,
-        grpc_target: str,
-        tmp_cassette_path: Path,
+        offline_target: str,
+        recorded_cassette_path: Path,
         grpc_servicer,
         pb2,
         pb2_grpc,
     ) -> None:
         """Playback a client streaming RPC call."""
-        cassette = Cassette(tmp_cassette_path, record_mode=RecordMode.ALL)
 
         def request_iterator():
             for name in ["Alice", "Bob", "Charlie"]:
                 yield pb2.CreateUserRequest(name=name, email=f"{name.lower()}@example.com")
 
-        with RecordingChannel(cassette, grpc_target) as recording:
-            stub = pb2_grpc.TestServiceStub(recording.channel)
-            stub.CreateUsers(request_iterator())
-
-        grpc_servicer.call_count = 0
-
-        cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        with RecordingChannel(cassette2, grpc_target) as recording:
+        cassette = Cassette(recorded_cassette_path, record_mode=RecordMode.NONE)
+        with RecordingChannel(cassette, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             response = stub.CreateUsers(request_iterator())
 
@@ -308,27 +286,20 @@ class TestBidiStreaming:
 
     def test_playback_bidi_streaming(
         self,
-        grpc_target: str,
-        tmp_cassette_path: Path,
+        offline_target: str,
+        recorded_cassette_path: Path,
         grpc_servicer,
         pb2,
         pb2_grpc,
     ) -> None:
         """Playback a bidirectional streaming RPC call."""
-        cassette = Cassette(tmp_cassette_path, record_mode=RecordMode.ALL)
 
         def request_iterator():
             yield pb2.ChatMessage(sender="client", content="Hello", timestamp=1000)
             yield pb2.ChatMessage(sender="client", content="World", timestamp=2000)
 
-        with RecordingChannel(cassette, grpc_target) as recording:
-            stub = pb2_grpc.TestServiceStub(recording.channel)
-            list(stub.Chat(request_iterator()))
-
-        grpc_servicer.call_count = 0
-
-        cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        with RecordingChannel(cassette2, grpc_target) as recording:
+        cassette = Cassette(recorded_cassette_path, record_mode=RecordMode.NONE)
+        with RecordingChannel(cassette, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             responses = list(stub.Chat(request_iterator()))
 
@@ -17,7 +17,7 @@ from grpcvcr import (
 from grpcvcr.errors import RecordingDisabledError
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncUnaryRecordingPlayback:
     """Test async unary RPC recording and playback."""
 
@@ -45,6 +45,7 @@ class TestAsyncUnaryRecordingPlayback:
     async def test_playback_unary_call(
         self,
         grpc_target: str,
+        offline_target: str,
         tmp_cassette_path: Path,
         grpc_servicer,
         pb2,
@@ -60,7 +61,36 @@ class TestAsyncUnaryRecordingPlayback:
 
         grpc_servicer.call_count = 0
         cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        async with AsyncRecordingChannel(cassette2, grpc_target) as recording:
+        async with AsyncRecordingChannel(cassette2, offline_target) as recording:
+            stub = pb2_grpc.TestServiceStub(recording.channel)
+            response = await stub.GetUser(pb2.GetUserRequest(id=42))
+
+        assert response.user.id == 42
+        assert grpc_servicer.call_count == 0
+
+    @pytest.mark.parametrize("suffix", [".pb", ".jsonl"])
+    async def test_playback_binary_and_jsonl_cassettes(
+        self,
+        grpc_target: str,
+        offline_target: str,
+        tmp_path: Path,
+        grpc_servicer,
+        pb2,
+        pb2_grpc,
+        suffix: str,
+    ) -> None:
+        """Record and replay through grpc.aio, which reports method paths as bytes."""
+        cassette_path = tmp_path / f"cassette{suffix}"
+        cassette = Cassette(cassette_path, record_mode=RecordMode.ALL)
+        async with AsyncRecordingChannel(cassette, grpc_target) as recording:
+            stub = pb2_grpc.TestServiceStub(recording.channel)
+            await stub.GetUser(pb2.GetUserRequest(id=42))
+
+        assert cassette.interactions[0].method == "/test.TestService/GetUser"
+
+        grpc_servicer.call_count = 0
+        cassette2 = Cassette(cassette_path, record_mode=RecordMode.NONE)
+        async with AsyncRecordingChannel(cassette2, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             response = await stub.GetUser(pb2.GetUserRequest(id=42))
 
@@ -85,7 +115,7 @@ class TestAsyncUnaryRecordingPlayback:
         assert tmp_cassette_path.exists()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncRecordModes:
     """Test different recording modes with async channels."""
 
@@ -137,7 +167,7 @@ class TestAsyncRecordModes:
         assert len(cassette2.interactions) == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncServerStreaming:
     """Test async server streaming RPC recording and playback."""
 
@@ -168,6 +198,7 @@ class TestAsyncServerStreaming:
     async def test_playback_server_streaming(
         self,
         grpc_target: str,
+        offline_target: str,
         tmp_cassette_path: Path,
         grpc_servicer,
         pb2,
@@ -183,7 +214,7 @@ class TestAsyncServerStreaming:
         grpc_servicer.call_count = 0
 
         cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        async with AsyncRecordingChannel(cassette2, grpc_target) as recording:
+        async with AsyncRecordingChannel(cassette2, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             responses = []
             async for response in stub.ListUsers(pb2.ListUsersRequest(limit=3)):
@@ -193,7 +224,7 @@ class TestAsyncServerStreaming:
         assert grpc_servicer.call_count == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncClientStreaming:
     """Test async client streaming RPC recording and playback."""
 
@@ -224,6 +255,7 @@ class TestAsyncClientStreaming:
     async def test_playback_client_streaming(
         self,
         grpc_target: str,
+        offline_target: str,
         tmp_cassette_path: Path,
         grpc_servicer,
         pb2,
@@ -243,7 +275,7 @@ class TestAsyncClientStreaming:
         grpc_servicer.call_count = 0
 
         cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        async with AsyncRecordingChannel(cassette2, grpc_target) as recording:
+        async with AsyncRecordingChannel(cassette2, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             response = await stub.CreateUsers(request_iterator())
 
@@ -251,7 +283,7 @@ class TestAsyncClientStreaming:
         assert grpc_servicer.call_count == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncBidiStreaming:
     """Test async bidirectional streaming RPC recording and playback."""
 
@@ -286,6 +318,7 @@ class TestAsyncBidiStreaming:
     async def test_playback_bidi_streaming(
         self,
         grpc_target: str,
+        offline_target: str,
         tmp_cassette_path: Path,
         grpc_servicer,
         pb2,
@@ -306,7 +339,7 @@ class TestAsyncBidiStreaming:
         grpc_servicer.call_count = 0
 
         cassette2 = Cassette(tmp_cassette_path, record_mode=RecordMode.NONE)
-        async with AsyncRecordingChannel(cassette2, grpc_target) as recording:
+        async with AsyncRecordingChannel(cassette2, offline_target) as recording:
             stub = pb2_grpc.TestServiceStub(recording.channel)
             responses = []
             async for response in stub.Chat(request_iterator()):
@@ -1,8 +1,16 @@
 """Tests for matchers module."""
 
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from grpcvcr.cassette import Cassette
 from grpcvcr.matchers import (
     AllMatcher,
     CustomMatcher,
+    Matcher,
     MetadataMatcher,
     MethodMatcher,
     RequestMatcher,
@@ -27,98 +35,149 @@ def make_request(
     return req
 
 
-class TestMethodMatcher:
-    def test_matches_same_method(self) -> None:
-        matcher = MethodMatcher()
-        req1 = make_request(method="/test/Method")
-        req2 = make_request(method="/test/Method")
-        assert matcher.matches(req1, req2)
-
-    def test_not_matches_different_method(self) -> None:
-        matcher = MethodMatcher()
-        req1 = make_request(method="/test/Method1")
-        req2 = make_request(method="/test/Method2")
-        assert not matcher.matches(req1, req2)
-
-
-class TestRequestMatcher:
-    def test_matches_same_body(self) -> None:
-        matcher = RequestMatcher()
-        req1 = make_request(body=b"same")
-        req2 = make_request(body=b"same")
-        assert matcher.matches(req1, req2)
-
-    def test_not_matches_different_body(self) -> None:
-        matcher = RequestMatcher()
-        req1 = make_request(body=b"body1")
-        req2 = make_request(body=b"body2")
-        assert not matcher.matches(req1, req2)
-
-
-class TestMetadataMatcher:
-    def test_matches_all_metadata(self) -> None:
-        matcher = MetadataMatcher()
-        req1 = make_request(metadata={"key": ["value"]})
-        req2 = make_request(metadata={"key": ["value"]})
-        assert matcher.matches(req1, req2)
-
-    def test_not_matches_different_metadata(self) -> None:
-        matcher = MetadataMatcher()
-        req1 = make_request(metadata={"key": ["value1"]})
-        req2 = make_request(metadata={"key": ["value2"]})
-        assert not matcher.matches(req1, req2)
-
-    def test_matches_specific_keys(self) -> None:
-        matcher = MetadataMatcher(keys=["important"])
-        req1 = make_request(metadata={"important": ["same"], "other": ["diff1"]})
-        req2 = make_request(metadata={"important": ["same"], "other": ["diff2"]})
-        assert matcher.matches(req1, req2)
-
-    def test_ignores_specified_keys(self) -> None:
-        matcher = MetadataMatcher(ignore_keys=["x-request-id"])
-        req1 = make_request(metadata={"x-request-id": ["123"], "auth": ["token"]})
-        req2 = make_request(metadata={"x-request-id": ["456"], "auth": ["token"]})
-        assert matcher.matches(req1, req2)
-
-
-class TestCustomMatcher:
-    def test_custom_function(self) -> None:
-        def always_true(req: InteractionRequest, rec: InteractionRequest) -> bool:
-            return True
-
-        matcher = CustomMatcher(func=always_true)
-        req1 = make_request()
-        req2 = make_request(method="/different")
-        assert matcher.matches(req1, req2)
-
-    def test_custom_function_false(self) -> None:
-        def always_false(req: InteractionRequest, rec: InteractionRequest) -> bool:
-            return False
-
-        matcher = CustomMatcher(func=always_false)
-        req1 = make_request()
-        req2 = make_request()
-        assert not matcher.matches(req1, req2)
+_MATCH_CASES = [
+    pytest.param(MethodMatcher(), {"method": "/test/Method"}, {"method": "/test/Method"}, True, id="method-same"),
+    pytest.param(
+        MethodMatcher(), {"method": "/test/Method1"}, {"method": "/test/Method2"}, False, id="method-different"
+    ),
+    pytest.param(RequestMatcher(), {"body": b"same"}, {"body": b"same"}, True, id="body-same"),
+    pytest.param(RequestMatcher(), {"body": b"body1"}, {"body": b"body2"}, False, id="body-different"),
+    pytest.param(
+        MetadataMatcher(),
+        {"metadata": {"key": ["value"]}},
+        {"metadata": {"key": ["value"]}},
+        True,
+        id="metadata-same",
+    ),
+    pytest.param(
+        MetadataMatcher(),
+        {"metadata": {"key": ["value1"]}},
+        {"metadata": {"key": ["value2"]}},
+        False,
+        id="metadata-different",
+    ),
+    pytest.param(
+        MetadataMatcher(keys=["important"]),
+        {"metadata": {"important": ["same"], "other": ["diff1"]}},
+        {"metadata": {"important": ["same"], "other": ["diff2"]}},
+        True,
+        id="metadata-specific-keys",
+    ),
+    pytest.param(
+        MetadataMatcher(ignore_keys=["x-request-id"]),
+        {"metadata": {"x-request-id": ["123"], "auth": ["token"]}},
+        {"metadata": {"x-request-id": ["456"], "auth": ["token"]}},
+        True,
+        id="metadata-ignored-keys",
+    ),
+    pytest.param(
+        MetadataMatcher(ignore_keys=["x-request-id"]),
+        {"metadata": {"x-request-id": ["123"], "auth": ["token1"]}},
+        {"metadata": {"x-request-id": ["456"]}},
+        False,
+        id="metadata-ignore-still-compares-others",
+    ),
+    pytest.param(
+        MetadataMatcher(ignore_keys=["x-request-id"]),
+        {"metadata": {"x-request-id": ["123"]}},
+        {"metadata": {"x-request-id": ["456"], "auth": ["token"]}},
+        False,
+        id="metadata-ignore-detects-recorded-only-keys",
+    ),
+    pytest.param(CustomMatcher(func=lambda req, rec: True), {}, {"method": "/different"}, True, id="custom-true"),
+    pytest.param(CustomMatcher(func=lambda req, rec: False), {}, {}, False, id="custom-false"),
+    pytest.param(
+        AllMatcher(matchers=[MethodMatcher(), RequestMatcher()]),
+        {"method": "/test", "body": b"body"},
+        {"method": "/test", "body": b"body"},
+        True,
+        id="all-match",
+    ),
+    pytest.param(
+        AllMatcher(matchers=[MethodMatcher(), RequestMatcher()]),
+        {"method": "/test", "body": b"body1"},
+        {"method": "/test", "body": b"body2"},
+        False,
+        id="all-one-fails",
+    ),
+]
+
+
+@pytest.mark.parametrize(("matcher", "request_args", "recorded_args", "expected"), _MATCH_CASES)
+def test_matches(
+    matcher: Matcher,
+    request_args: dict[str, Any],
+    recorded_args: dict[str, Any],
+    expected: bool,
+) -> None:
+    assert matcher.matches(make_request(**request_args), make_request(**recorded_args)) is expected
 
 
 class TestAllMatcher:
-    def test_all_must_match(self) -> None:
-        matcher = AllMatcher(matchers=[MethodMatcher(), RequestMatcher()])
-        req1 = make_request(method="/test", body=b"body")
-        req2 = make_request(method="/test", body=b"body")
-        assert matcher.matches(req1, req2)
-
-    def test_fails_if_any_fails(self) -> None:
-        matcher = AllMatcher(matchers=[MethodMatcher(), RequestMatcher()])
-        req1 = make_request(method="/test", body=b"body1")
-        req2 = make_request(method="/test", body=b"body2")
-        assert not matcher.matches(req1, req2)
-
     def test_combine_with_and(self) -> None:
         matcher = MethodMatcher() & RequestMatcher()
         assert isinstance(matcher, AllMatcher)
         assert len(matcher.matchers) == 2
 
+    def test_combine_flattens_nested_all_matchers(self) -> None:
+        method, metadata, body = MethodMatcher(), MetadataMatcher(), RequestMatcher()
+        matcher = method & (metadata & body)
+        assert matcher.matchers == [method, metadata, body]
+
+    def test_constructor_flattens_nested_all_matchers(self) -> None:
+        method, metadata, body = MethodMatcher(), MetadataMatcher(), RequestMatcher()
+        matcher = AllMatcher(matchers=[AllMatcher(matchers=[method, metadata]), body])
+        assert matcher.matchers == [method, metadata, body]
+
+    def test_index_key_combines_indexable_matchers(self) -> None:
+        matcher = MethodMatcher() & MetadataMatcher() & RequestMatcher()
+        req = make_request(method="/test", body=b"body")
+        assert matcher.index_key(req) == ("/test", req.body)
+
+    def test_index_key_none_without_indexable_matchers(self) -> None:
+        matcher = MetadataMatcher() & CustomMatcher(func=lambda req, rec: True)
+        assert matcher.index_key(make_request()) is None
+
+
+class TestIndexKey:
+    def test_method_matcher_keys_on_method(self) -> None:
+        assert MethodMatcher().index_key(make_request(method="/test")) == "/test"
+
+    def test_request_matcher_keys_on_body(self) -> None:
+        req = make_request(body=b"body")
+        assert RequestMatcher().index_key(req) == req.body
+
+    def test_unindexable_matchers_return_none(self) -> None:
+        assert MetadataMatcher().index_key(make_request()) is None
+        assert CustomMatcher(func=lambda req, rec: True).index_key(make_request()) is None
+
+    @pytest.mark.parametrize("base", [MethodMatcher, RequestMatcher])
+    def test_subclass_overriding_matches_is_not_indexed(self, base: type[Matcher], tmp_path: Path) -> None:
+        class AnyRequest(base):  # type: ignore[misc, valid-type]
+            def matches(self, request: InteractionRequest, recorded: InteractionRequest) -> bool:
+                return True
+
+        matcher = AnyRequest()
+        assert matcher.index_key(make_request()) is None
+
+        cassette = Cassette(tmp_path / "cassette.yaml", match_on=matcher)
+        cassette.record_interaction(
+            Interaction(
+                request=make_request(method="/test/A", body=b"a"),
+                response=InteractionResponse.from_grpc(b"resp", "OK"),
+                rpc_type="unary",
+            )
+        )
+        assert cassette.find_interaction(make_request("/test/B", b"b")) is not None
+
+    @pytest.mark.parametrize("base", [MethodMatcher, RequestMatcher])
+    def test_dataclass_subclass(self, base: type[Matcher]) -> None:
+        @dataclass
+        class Prefixed(base):  # type: ignore[misc, valid-type]
+            prefix: str = "/test"
+
+        assert Prefixed(prefix="/other").prefix == "/other"
+
 
 class TestFindMatchingInteraction:
     def test_finds_match(self) -> None:
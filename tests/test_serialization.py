@@ -1,11 +1,15 @@
 """Tests for serialization module."""
 
 import base64
-import tempfile
+import dataclasses
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from grpcvcr import serialization
+from grpcvcr.errors import SerializationError
 from grpcvcr.serialization import (
     CassetteData,
     CassetteSerializer,
@@ -42,6 +46,57 @@ class TestInteractionRequest:
         )
         assert req.get_body_bytes() == b"hello world"
 
+    def test_get_body_bytes_caches_result(self) -> None:
+        body = b"hello world"
+        assert InteractionRequest.from_grpc("/test/Method", body).get_body_bytes() is body
+
+        req = InteractionRequest.from_dict({"method": "/test/Method", "body": base64.b64encode(body).decode("ascii")})
+        assert req.get_body_bytes() is req.get_body_bytes()
+        assert req.get_body_bytes() == body
+
+        req.body = base64.b64encode(b"other").decode("ascii")
+        assert req.get_body_bytes() == b"other"
+
+        view = InteractionRequest.from_grpc("/test/Method", memoryview(b"xxbodyxx")[2:6])
+        assert view.get_body_bytes() == b"body"
+
+    def test_from_grpc_interns_method_and_metadata_keys(self) -> None:
+        method = "".join(["/test/", "Method"])
+        key = "".join(["x-", "key"])
+        req1 = InteractionRequest.from_grpc(method, b"", ((key, "1"),))
+        req2 = InteractionRequest.from_grpc("".join(["/test/", "Method"]), b"", (("".join(["x-", "key"]), "2"),))
+        assert req1.method is req2.method
+        assert next(iter(req1.metadata)) is next(iter(req2.metadata))
+
+    def test_bytes_method_is_decoded(self) -> None:
+        assert InteractionRequest.from_grpc(b"/test/Method", b"").method == "/test/Method"  # type: ignore[arg-type]
+        assert InteractionRequest.from_dict({"method": b"/test/Method", "body": ""}).method == "/test/Method"
+
+    def test_from_grpc_with_metadata_iterator(self) -> None:
+        pairs = [("key1", "value1"), ("key2", "value2"), ("key1", "value3")]
+        req = InteractionRequest.from_grpc("/test/Method", b"body", iter(pairs))
+
+        assert req.metadata == {"key1": ["value1", "value3"], "key2": ["value2"]}
+
+    def test_from_grpc_with_mapping_metadata(self) -> None:
+        metadata = {"key1": ("value1", "value2"), "key2": ["value3"]}
+        req = InteractionRequest.from_grpc("/test/Method", b"body", metadata)
+
+        assert req.metadata == {"key1": ["value1", "value2"], "key2": ["value3"]}
+        assert req.metadata["key2"] is not metadata["key2"]
+
+    def test_from_grpc_with_single_value_mapping_metadata(self) -> None:
+        req = InteractionRequest.from_grpc("/test/Method", b"body", {"authorization": "Bearer x"})
+
+        assert req.metadata == {"authorization": ["Bearer x"]}
+
+    def test_base64_without_pybase64(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serialization, "pybase64", None)
+
+        request = InteractionRequest.from_grpc("/test/Method", b"\x00\xffbody")
+        assert request.body == base64.b64encode(b"\x00\xffbody").decode("ascii")
+        assert InteractionRequest.from_dict(request.to_dict()).get_body_bytes() == b"\x00\xffbody"
+
 
 class TestInteractionResponse:
     def test_from_grpc_success(self) -> None:
@@ -53,6 +108,48 @@ class TestInteractionResponse:
         assert resp.details is None
         assert resp.get_body_bytes() == b"response"
 
+    def test_from_grpc_groups_trailing_metadata(self) -> None:
+        resp = InteractionResponse.from_grpc(
+            body=b"response",
+            code="OK",
+            trailing_metadata=(("t1", "a"), ("t2", "b"), ("t1", "c")),
+        )
+        assert resp.trailing_metadata == {"t1": ["a", "c"], "t2": ["b"]}
+
+    def test_from_grpc_with_mapping_trailing_metadata(self) -> None:
+        resp = InteractionResponse.from_grpc(b"response", "OK", trailing_metadata={"t1": ["a", "c"]})
+        assert resp.trailing_metadata == {"t1": ["a", "c"]}
+
+    def test_deserialize_caches_result(self) -> None:
+        resp = InteractionResponse.from_grpc(b"response", "OK")
+        calls: list[bytes] = []
+
+        def deserializer(data: bytes) -> bytes:
+            calls.append(data)
+            return data.upper()
+
+        assert resp.deserialize(deserializer) == b"RESPONSE"
+        assert resp.deserialize(deserializer) is resp.deserialize(deserializer)
+        assert calls == [b"response"]
+
+        resp.body = base64.b64encode(b"other").decode("ascii")
+        assert resp.deserialize(deserializer) == b"OTHER"
+        assert resp.deserialize(bytes.decode) == "other"
+        assert calls == [b"response", b"other"]
+
+    def test_trailing_metadata_pairs_cached(self) -> None:
+        resp = InteractionResponse.from_grpc(b"", "OK", trailing_metadata=(("k", "1"), ("k", "2"), ("x", "3")))
+
+        pairs = resp.trailing_metadata_pairs()
+        assert pairs == (("k", "1"), ("k", "2"), ("x", "3"))
+        assert resp.trailing_metadata_pairs() is pairs
+
+        resp.trailing_metadata = {"y": ["4"]}
+        assert resp.trailing_metadata_pairs() == (("y", "4"),)
+
+        loaded = InteractionResponse.from_dict(resp.to_dict())
+        assert loaded.trailing_metadata_pairs() == (("y", "4"),)
+
     def test_from_grpc_error(self) -> None:
         resp = InteractionResponse.from_grpc(
             body=b"",
@@ -72,6 +169,48 @@ class TestStreamingInteractionResponse:
         assert len(resp.messages) == 3
         assert resp.get_messages_bytes() == [b"msg1", b"msg2", b"msg3"]
 
+    def test_deserialize_messages_caches_result(self) -> None:
+        resp = StreamingInteractionResponse.from_grpc([b"m1", b"m2"], "OK")
+        calls: list[bytes] = []
+
+        def deserializer(data: bytes) -> bytes:
+            calls.append(data)
+            return data.upper()
+
+        assert resp.deserialize_messages(deserializer) == [b"M1", b"M2"]
+        assert resp.deserialize_messages(deserializer) is resp.deserialize_messages(deserializer)
+        assert calls == [b"m1", b"m2"]
+
+        loaded = StreamingInteractionResponse.from_dict(resp.to_dict())
+        assert loaded.deserialize_messages(deserializer) == [b"M1", b"M2"]
+        assert calls == [b"m1", b"m2", b"m1", b"m2"]
+
+    def test_iter_messages_decodes_lazily(self) -> None:
+        resp = StreamingInteractionResponse.from_grpc([b"m1", b"m2", b"m3"], "OK")
+        calls: list[bytes] = []
+
+        def deserializer(data: bytes) -> bytes:
+            calls.append(data)
+            return data.upper()
+
+        with patch.object(serialization, "_b64decode", wraps=serialization._b64decode) as b64decode:
+            partial = resp.iter_messages(deserializer)
+            assert next(partial) == b"M1"
+        assert calls == [b"m1"]
+        assert b64decode.call_count == 1
+
+        assert list(resp.iter_messages(deserializer)) == [b"M1", b"M2", b"M3"]
+        assert list(resp.iter_messages(deserializer)) == [b"M1", b"M2", b"M3"]
+        assert resp.deserialize_messages(deserializer) == [b"M1", b"M2", b"M3"]
+        assert calls == [b"m1", b"m1", b"m2", b"m3"]
+
+    def test_base64_without_pybase64(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serialization, "pybase64", None)
+
+        resp = StreamingInteractionResponse.from_grpc([b"\x00\xff", b"msg2"], "OK")
+        assert resp.messages == [base64.b64encode(m).decode("ascii") for m in (b"\x00\xff", b"msg2")]
+        assert resp.get_messages_bytes() == [b"\x00\xff", b"msg2"]
+
 
 class TestInteraction:
     def test_to_dict_and_from_dict_unary(self) -> None:
@@ -101,51 +240,359 @@ class TestInteraction:
         assert restored.rpc_type == "server_streaming"
         assert isinstance(restored.response, StreamingInteractionResponse)
 
+    def test_from_dict_fills_defaults_for_omitted_fields(self) -> None:
+        unary = Interaction.from_dict(
+            {
+                "request": {"method": "/test/Method", "body": "cmVx"},
+                "response": {"body": "cmVzcA==", "code": "OK"},
+                "rpc_type": "unary",
+            }
+        )
+        streaming = Interaction.from_dict(
+            {
+                "request": {"method": "/test/Stream", "body": "cmVx"},
+                "response": {"messages": ["bTE="], "code": "OK"},
+                "rpc_type": "bidi_streaming",
+            }
+        )
+
+        assert unary == Interaction(
+            request=InteractionRequest(method="/test/Method", body="cmVx"),
+            response=InteractionResponse(body="cmVzcA==", code="OK"),
+            rpc_type="unary",
+        )
+        assert streaming.response == StreamingInteractionResponse(messages=["bTE="], code="OK")
+
+    def test_to_dict_matches_dataclass_fields(self) -> None:
+        request = InteractionRequest.from_grpc("/test/Method", b"req", (("key", "value"),))
+        unary = InteractionResponse.from_grpc(b"resp", "OK", trailing_metadata=(("t", "1"),))
+        streaming = StreamingInteractionResponse.from_grpc([b"m1"], "OK", details="done")
+
+        def public_fields(record: object) -> dict[str, object]:
+            return {k: v for k, v in dataclasses.asdict(record).items() if not k.startswith("_")}  # type: ignore[call-overload]
+
+        assert request.to_dict() == public_fields(request)
+        assert unary.to_dict() == public_fields(unary)
+        assert streaming.to_dict() == public_fields(streaming)
+
+        data = request.to_dict()
+        data["metadata"]["key"].append("other")
+        assert request.metadata == {"key": ["value"]}
+
+    @pytest.mark.parametrize(
+        "record_cls",
+        [InteractionRequest, InteractionResponse, StreamingInteractionResponse, Interaction, CassetteData],
+    )
+    def test_records_use_slots(self, record_cls: type) -> None:
+        assert "__slots__" in vars(record_cls)
+        assert "__dict__" not in vars(record_cls)
+
+    def test_caches_are_not_dataclass_fields(self) -> None:
+        request = InteractionRequest.from_grpc("/test/Method", b"req")
+        response = StreamingInteractionResponse.from_grpc([b"m"], "OK")
+        request.get_body_bytes()
+        response.deserialize_messages(bytes)
+        response.trailing_metadata_pairs()
+
+        for record in (request, response, InteractionResponse.from_grpc(b"resp", "OK")):
+            assert not any(f.name.startswith("_") for f in dataclasses.fields(record))
+            assert not any(key.startswith("_") for key in dataclasses.asdict(record))
+
 
 class TestCassetteSerializer:
-    def test_save_and_load_yaml(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.yaml"
-
-            data = CassetteData(
-                version=1,
-                interactions=[
-                    Interaction(
-                        request=InteractionRequest.from_grpc("/test/Method", b"req"),
-                        response=InteractionResponse.from_grpc(b"resp", "OK"),
-                        rpc_type="unary",
-                    )
-                ],
-            )
+    def test_save_and_load_yaml(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.yaml"
 
-            CassetteSerializer.save(path, data)
-            assert path.exists()
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req"),
+                    response=InteractionResponse.from_grpc(b"resp", "OK"),
+                    rpc_type="unary",
+                )
+            ],
+        )
 
-            loaded = CassetteSerializer.load(path)
-            assert loaded.version == 1
-            assert len(loaded.interactions) == 1
-            assert loaded.interactions[0].request.method == "/test/Method"
-
-    def test_save_and_load_json(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.json"
-
-            data = CassetteData(
-                version=1,
-                interactions=[
-                    Interaction(
-                        request=InteractionRequest.from_grpc("/test/Method", b"req"),
-                        response=InteractionResponse.from_grpc(b"resp", "OK"),
-                        rpc_type="unary",
-                    )
-                ],
-            )
+        CassetteSerializer.save(path, data)
+        assert path.exists()
 
-            CassetteSerializer.save(path, data)
-            loaded = CassetteSerializer.load(path)
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+        assert len(loaded.interactions) == 1
+        assert loaded.interactions[0].request.method == "/test/Method"
 
-            assert len(loaded.interactions) == 1
+    def test_save_and_load_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.json"
+
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req"),
+                    response=InteractionResponse.from_grpc(b"resp", "OK"),
+                    rpc_type="unary",
+                )
+            ],
+        )
+
+        CassetteSerializer.save(path, data)
+        loaded = CassetteSerializer.load(path)
+
+        assert len(loaded.interactions) == 1
 
     def test_load_nonexistent_raises(self) -> None:
         with pytest.raises(FileNotFoundError):
             CassetteSerializer.load(Path("/nonexistent/path.yaml"))
+
+    def test_save_and_load_jsonl(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.jsonl"
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req", (("key", "value"),)),
+                    response=InteractionResponse.from_grpc(b"resp", "OK"),
+                    rpc_type="unary",
+                ),
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Stream", b"req"),
+                    response=StreamingInteractionResponse.from_grpc([b"m1", b"m2"], "OK"),
+                    rpc_type="server_streaming",
+                ),
+            ],
+        )
+
+        CassetteSerializer.save(path, data)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+        assert loaded.interactions == data.interactions
+
+    def test_load_jsonl_skips_blank_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.jsonl"
+        path.write_text('{"version": 1}\n\n', encoding="utf-8")
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.interactions == []
+
+    def test_load_empty_jsonl(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.jsonl"
+        path.write_bytes(b"")
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+        assert loaded.interactions == []
+
+    def test_load_json_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serialization, "orjson", None)
+        path = tmp_path / "test.json"
+        path.write_text('{"version": 1, "interactions": []}', encoding="utf-8")
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.interactions == []
+
+    @pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+    def test_save_json_without_orjson(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, suffix: str) -> None:
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Método", b"req", [("clé", "välue")]),
+                    response=InteractionResponse.from_grpc(b"resp", "OK"),
+                    rpc_type="unary",
+                )
+            ],
+        )
+        fast_path = tmp_path / f"fast{suffix}"
+        CassetteSerializer.save(fast_path, data)
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        stdlib_path = tmp_path / f"stdlib{suffix}"
+        CassetteSerializer.save(stdlib_path, data)
+
+        assert stdlib_path.read_bytes() == fast_path.read_bytes()
+        assert CassetteSerializer.load(stdlib_path).interactions == data.interactions
+
+    def test_save_json_matches_to_dict(self, tmp_path: Path) -> None:
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req", [("key", "value")]),
+                    response=StreamingInteractionResponse.from_grpc([b"a", b"b"], "OK"),
+                    rpc_type="server_streaming",
+                )
+            ],
+        )
+        path = tmp_path / "test.json"
+        CassetteSerializer.save(path, data)
+
+        assert json.loads(path.read_bytes()) == data.to_dict()
+
+    def test_save_and_load_pb(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.pb"
+        data = CassetteData(
+            version=1,
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req", (("key", "value"),)),
+                    response=InteractionResponse.from_grpc(
+                        b"resp",
+                        "NOT_FOUND",
+                        details="missing",
+                        trailing_metadata=(("trailer", "1"), ("trailer", "2")),
+                        response_type=CassetteData,
+                    ),
+                    rpc_type="unary",
+                ),
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Stream", b""),
+                    response=StreamingInteractionResponse.from_grpc([b"m1", b"", b"m2"], "OK"),
+                    rpc_type="server_streaming",
+                ),
+            ],
+        )
+
+        CassetteSerializer.save(path, data)
+        assert path.stat().st_size < len(json.dumps(data.to_dict()))
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+        assert loaded.interactions == data.interactions
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".json", ".jsonl", ".pb"])
+    def test_load_interns_methods(self, tmp_path: Path, suffix: str) -> None:
+        path = tmp_path / f"test{suffix}"
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/Method", b"", (("x-key", "1"),)),
+            response=InteractionResponse.from_grpc(b"", "OK"),
+            rpc_type="unary",
+        )
+        CassetteSerializer.save(path, CassetteData(interactions=[interaction, interaction]))
+
+        first, second = CassetteSerializer.load(path).interactions
+        assert first.request.method is second.request.method
+        assert next(iter(first.request.metadata)) is next(iter(second.request.metadata))
+
+    def test_load_empty_pb(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.pb"
+        path.write_bytes(b"")
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+        assert loaded.interactions == []
+
+    def test_load_pb_header_without_version(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.pb"
+        path.write_bytes(b"\x00\x00\x00\x00")
+
+        loaded = CassetteSerializer.load(path)
+        assert loaded.version == 1
+
+    def test_load_truncated_pb_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.pb"
+        CassetteSerializer.save(path, CassetteData())
+        path.write_bytes(path.read_bytes() + b"\xff\x00\x00\x00")
+
+        with pytest.raises(SerializationError, match="Failed to parse"):
+            CassetteSerializer.load(path)
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".pb"])
+    def test_load_large_file_through_mmap(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, suffix: str) -> None:
+        monkeypatch.setattr(serialization, "_MMAP_THRESHOLD", 1)
+        path = tmp_path / f"test{suffix}"
+        data = CassetteData(
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req"),
+                    response=StreamingInteractionResponse.from_grpc([b"m1", b"m2"], "OK"),
+                    rpc_type="server_streaming",
+                )
+            ]
+        )
+        CassetteSerializer.save(path, data)
+
+        with patch.object(Path, "read_bytes") as read_bytes:
+            loaded = CassetteSerializer.load(path)
+        read_bytes.assert_not_called()
+        assert loaded.interactions == data.interactions
+
+    def test_load_large_truncated_pb_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serialization, "_MMAP_THRESHOLD", 1)
+        path = tmp_path / "test.pb"
+        CassetteSerializer.save(path, CassetteData())
+        path.write_bytes(path.read_bytes() + b"\xff\x00\x00\x00")
+
+        with pytest.raises(SerializationError, match="Failed to parse"):
+            CassetteSerializer.load(path)
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".pb"])
+    def test_append(self, tmp_path: Path, suffix: str) -> None:
+        path = tmp_path / f"test{suffix}"
+        first = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"req"),
+            response=InteractionResponse.from_grpc(b"resp", "OK"),
+            rpc_type="unary",
+        )
+        second = Interaction(
+            request=InteractionRequest.from_grpc("/test/B", b"req"),
+            response=StreamingInteractionResponse.from_grpc([b"m1"], "OK"),
+            rpc_type="server_streaming",
+        )
+
+        CassetteSerializer.save(path, CassetteData(interactions=[first]))
+        assert CassetteSerializer.can_append(path)
+        CassetteSerializer.append(path, [second])
+
+        assert CassetteSerializer.load(path).interactions == [first, second]
+
+    def test_append_jsonl_without_trailing_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.jsonl"
+        path.write_text('{"version": 1}', encoding="utf-8")
+        interaction = Interaction(
+            request=InteractionRequest.from_grpc("/test/A", b"req"),
+            response=InteractionResponse.from_grpc(b"resp", "OK"),
+            rpc_type="unary",
+        )
+
+        CassetteSerializer.append(path, [interaction])
+
+        assert CassetteSerializer.load(path).interactions == [interaction]
+
+    def test_cannot_append_yaml_or_json(self) -> None:
+        assert not CassetteSerializer.can_append(Path("test.yaml"))
+        assert not CassetteSerializer.can_append(Path("test.json"))
+
+    def test_append_to_empty_jsonl(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.jsonl"
+        path.write_bytes(b"")
+
+        CassetteSerializer.append(path, [])
+
+        assert path.read_bytes() == b""
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".json", ".jsonl", ".pb"])
+    def test_save_skips_unchanged_file(self, tmp_path: Path, suffix: str) -> None:
+        path = tmp_path / f"test{suffix}"
+        data = CassetteData(
+            interactions=[
+                Interaction(
+                    request=InteractionRequest.from_grpc("/test/Method", b"req"),
+                    response=InteractionResponse.from_grpc(b"resp", "OK"),
+                    rpc_type="unary",
+                )
+            ]
+        )
+        CassetteSerializer.save(path, data)
+
+        with patch.object(Path, "write_bytes") as write_bytes:
+            CassetteSerializer.save(path, data)
+        write_bytes.assert_not_called()
+
+        data.interactions[0].request.method = "/test/Other"
+        with patch.object(Path, "write_bytes") as write_bytes:
+            CassetteSerializer.save(path, data)
+        write_bytes.assert_called_once()